@@ -0,0 +1,147 @@
+"""
+The extractor benchmark times the per-page hot path on the recorded result pages in benchmarks/fixtures, without touching the network.
+It covers the parsing functions of helpers/extractor.py and the Reports writers, so parser or report changes can be compared before and after.
+Reports.json_report only measures queueing a record; ReportWriter.dump measures the serialization and buffered write that the writer thread does for it.
+
+Fixtures:
+
+    * normal.html: a result page with 10 results, a "People also search for" block and a pager up to page 10
+    * empty.html: a result page for a query that did not match any documents
+    * blocked.html: the "Google Search" page that asks for javascript (the scraper retries it)
+    * sorry.html: the /sorry/index reCAPTCHA page a blocked request is redirected to
+
+Usage:
+
+    python benchmarks/bench_extractor.py [--number 500] [--fixture normal] [--json]
+
+For every case the script reports calls per second (pages/sec), the number of memory blocks allocated per call and the peak traced memory of one call.
+With --json the same numbers are printed as one JSON object per line, which is easy to diff between two commits.
+
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from godork.helpers import extractor
+from godork.helpers.reports import Reports
+from godork.helpers.output import ResultWriter
+from godork.utils.exceptions import GodorkNoData
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def load_fixtures(names=None):
+    fixtures = {}
+    for filename in sorted(os.listdir(FIXTURES_DIR)):
+        name, ext = os.path.splitext(filename)
+        if ext == ".html" and (not names or name in names):
+            with open(os.path.join(FIXTURES_DIR, filename), "r", encoding="utf-8") as f:
+                fixtures[name] = f.read()
+    return fixtures
+
+def ignore_errors(func):
+    def wrapper(*args):
+        try:
+            func(*args)
+        except (IndexError, GodorkNoData):
+            pass
+    return wrapper
+
+def measure(func, args, number):
+    """
+    This function runs func(*args) `number` times and returns calls per second, then measures the allocations and peak memory of a single call with tracemalloc.
+    """
+
+    func(*args)
+
+    start = time.perf_counter()
+    for _ in range(number):
+        func(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+        func(*args)
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    else:
+        # reset_peak() is new in Python 3.9, so on 3.8 the peak is measured in a fresh tracing session without the snapshot
+        func(*args)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        tracemalloc.start()
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+
+    return {
+        "per_sec": number / elapsed if elapsed else float("inf"),
+        "usec_per_call": elapsed / number * 1e6,
+        "alloc_blocks": blocks,
+        "peak_kb": peak / 1024,
+    }
+
+def cases(fixtures, reports, report_file):
+    metadata = {"query": "intitle:index.of site:example.com", "num_page": 1}
+    results = [{"title": f"Index of /files/{num}", "link": f"https://files{num}.example.com/pub/"} for num in range(10)]
+    record = {"timestamp": "2024-01-01 00:00:00", "query": metadata["query"], "page": 1, "size_page": 0, "new": 10, "duplicates": 0, "data_output": results}
+    output = ResultWriter("text")
+
+    for name, html in fixtures.items():
+        yield name, "extract_pages", ignore_errors(extractor.extract_pages), (html,)
+        yield name, "extract_title", extractor.extract_title, (html,)
+        yield name, "extract_link", extractor.extract_link, (html,)
+        yield name, "parse_page", extractor.parse_page, (html,)
+        yield name, "parse_bytes", extractor.parse_bytes, (html.encode("utf-8"),)
+        yield name, "extract_data", ignore_errors(extractor.extract_data), (html, reports, metadata, None, None, output)
+
+    # json_report only queues the record, the serialization and the write happen in ReportWriter.dump on the writer thread
+    yield "-", "Reports.json_report(queue)", reports.json_report, (record,)
+    yield "-", "ReportWriter.dump", reports.json_writer.dump, (report_file, record)
+    yield "-", "Reports.logs_report", reports.logs_report, ("info", "Found 10 results on page 1")
+    yield "-", "Reports.logs_report(debug)", reports.logs_report, ("debug", "Initiating request to %s", "https://www.google.com/search")
+
+def main():
+    parser = argparse.ArgumentParser(prog="bench_extractor")
+    parser.add_argument("--number", type=int, default=500, help="calls per case (default: 500)")
+    parser.add_argument("--fixture", action="append", help="only run this fixture (repeatable)")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per case")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixture)
+    results = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        reports = Reports()
+        reports.log_file = os.path.join(temp_dir, "bench.log")
+        reports.json_writer.filename = os.path.join(temp_dir, "bench.ndjson")
+        for handler in reports.logger.handlers:
+            handler.filename = reports.log_file
+
+        # extract_data and the logger print to the terminal, which would dominate the timings
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), \
+                open(os.path.join(temp_dir, "dump.ndjson"), "at", encoding="utf-8", buffering=reports.json_writer.max_buffer) as report_file:
+            for fixture, name, func, func_args in cases(fixtures, reports, report_file):
+                results.append({"fixture": fixture, "case": name, **measure(func, func_args, args.number)})
+            reports.close()
+
+    for result in results:
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(f"{result['fixture']:<8} {result['case']:<28} {result['per_sec']:>12,.0f}/s {result['usec_per_call']:>10.1f} us "
+                  f"{result['alloc_blocks']:>8} blocks {result['peak_kb']:>10.1f} KB peak")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+The load harness runs the real Scraper end to end against the local mock search server (benchmarks/mock_server.py), so concurrency,
+retry and fallback changes can be measured on the full request path without touching the real service.
+
+For every combination of concurrency level and dork-list size the harness:
+
+    * Starts a fresh Scraper with base_url pointing at the mock server.
+    * Replaces the browser fallback with an instant stub that lands on the sorry page, so redirected requests exercise the
+      FETCH/FALLBACK state machine without launching Chrome. The stub waits --bypass-delay seconds to stand in for the browser.
+    * Samples the resident memory of the process while the dorks are scraped.
+
+Usage:
+
+    python benchmarks/load_harness.py [--concurrency 1 4 16] [--dorks 10 100] [--pages 5] [--latency 0.05] [--redirect-rate 0.02] [--json]
+
+Each run reports the wall time, requests served by the mock, result pages per second, errors, blocked pages, redirects, retries
+counted by the scraper (blocked pages, circuit breaker waits and repeated bypasses), browser bypasses and the peak resident memory. The scraper output and reports are written to a temporary directory.
+
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import contextlib
+
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+import psutil
+
+from aiohttp import ClientSession
+from mock_server import MockSearchServer
+from godork.services.scrape import Scraper
+
+def make_dorks(size):
+    return "\n".join(f"intitle:index.of bench-{num}" for num in range(size))
+
+def redirect_reports(scraper, temp_dir):
+    scraper.reports.base_dir = temp_dir
+    scraper.reports.log_file = os.path.join(temp_dir, "godork.log")
+    scraper.reports.json_writer.filename = os.path.join(temp_dir, "godork.ndjson")
+    for handler in scraper.reports.logger.handlers:
+        handler.filename = scraper.reports.log_file
+
+def stub_bypass(scraper, server, delay, counters):
+    async def reuse_connection(url):
+        counters["bypasses"] += 1
+        await asyncio.sleep(delay)
+        # A solved captcha sends the browser back to the original search URL, which the scraper then re-fetches over HTTP
+        continue_url = parse_qs(urlparse(url).query)["continue"][0]
+        return continue_url, server.sorry
+
+    scraper.reuse_connection = reuse_connection
+
+async def sample_memory(process, peak):
+    while True:
+        peak[0] = max(peak[0], process.memory_info().rss)
+        await asyncio.sleep(0.05)
+
+async def run_once(server, port, args, concurrency, size, temp_dir):
+    scraper = Scraper(
+        dorks=make_dorks(size),
+        proxy=None,
+        debug=False,
+        retries=args.retries,
+        max_retries=args.max_retries,
+        headless_mode=True,
+        concurrency=concurrency,
+        backoff=args.backoff,
+        dedup=args.dedup,
+        parse_workers=args.parse_workers,
+        rate=args.rate,
+        max_rate=args.max_rate,
+        breaker_threshold=args.breaker_threshold,
+        breaker_cooldown=args.breaker_cooldown,
+    )
+    scraper.base_url = f"http://127.0.0.1:{port}/search"
+    redirect_reports(scraper, temp_dir)
+
+    counters = {"bypasses": 0}
+    stub_bypass(scraper, server, args.bypass_delay, counters)
+    server.counters.clear()
+
+    process = psutil.Process(os.getpid())
+    peak = [process.memory_info().rss]
+    sampler = asyncio.ensure_future(sample_memory(process, peak))
+
+    start = time.perf_counter()
+    async with ClientSession() as session:
+        try:
+            await scraper.fetch_links(session, url=scraper.base_url)
+        finally:
+            scraper.parse_pool.close()
+            scraper.reports.close()
+    elapsed = time.perf_counter() - start
+
+    sampler.cancel()
+    peak[0] = max(peak[0], process.memory_info().rss)
+
+    stats = server.counters
+    return {
+        "concurrency": concurrency,
+        "dorks": size,
+        "seconds": elapsed,
+        "requests": stats["requests"],
+        "pages": stats["ok"],
+        "pages_per_sec": stats["ok"] / elapsed if elapsed else float("inf"),
+        "errors": stats["error"],
+        "blocked": stats["blocked"],
+        "redirects": stats["redirect"],
+        "retries": scraper.metrics.total("retries"),
+        "bypasses": counters["bypasses"],
+        "peak_rss_mb": peak[0] / 1024 ** 2,
+    }
+
+async def run(args):
+    server = MockSearchServer(args.latency, args.jitter, args.error_rate, args.blocked_rate, args.redirect_rate, args.pages, args.seed, args.throttle_rate)
+    port = await server.start()
+    results = []
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # The scraper prints every result and log line, which would dominate the timings
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                for size in args.dorks:
+                    for concurrency in args.concurrency:
+                        results.append(await run_once(server, port, args, concurrency, size, temp_dir))
+    finally:
+        await server.stop()
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(prog="load_harness")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="concurrency levels to run (default: 1 4 16)")
+    parser.add_argument("--dorks", type=int, nargs="+", default=[10, 100], help="dork-list sizes to run (default: 10 100)")
+    parser.add_argument("--pages", type=int, default=5, help="result pages per dork (default: 5)")
+    parser.add_argument("--latency", type=float, default=0.05, help="base response latency in seconds (default: 0.05)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="extra random latency in seconds (default: 0.02)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500 responses (default: 0)")
+    parser.add_argument("--blocked-rate", type=float, default=0.0, help="share of javascript 'Google Search' pages (default: 0)")
+    parser.add_argument("--redirect-rate", type=float, default=0.0, help="share of 302 redirects to /sorry/index (default: 0)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="requests per second above which the mock server redirects to /sorry/index (default: 0, off)")
+    parser.add_argument("--bypass-delay", type=float, default=0.5, help="seconds the stubbed browser bypass takes (default: 0.5)")
+    parser.add_argument("--retries", type=int, default=3, help="scraper --retries (default: 3)")
+    parser.add_argument("--max-retries", type=int, default=2, help="scraper --max-retries (default: 2)")
+    parser.add_argument("--backoff", type=float, default=0.05, help="scraper --backoff (default: 0.05)")
+    parser.add_argument("--dedup", choices=["exact", "bloom", "off"], default="exact", help="scraper --dedup (default: exact)")
+    parser.add_argument("--parse-workers", type=int, default=0, help="scraper --parse-workers (default: 0)")
+    parser.add_argument("--rate", type=float, default=0.0, help="scraper --rate, 0 disables the rate limiter (default: 0)")
+    parser.add_argument("--max-rate", type=float, default=20.0, help="scraper --max-rate (default: 20)")
+    parser.add_argument("--breaker-threshold", type=int, default=0, help="scraper --breaker-threshold, 0 disables the circuit breaker (default: 0)")
+    parser.add_argument("--breaker-cooldown", type=float, default=60.0, help="scraper --breaker-cooldown (default: 60)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed of the mock server (default: 1)")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per run")
+    args = parser.parse_args()
+
+    for result in asyncio.run(run(args)):
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(f"c={result['concurrency']:<4} dorks={result['dorks']:<6} {result['seconds']:>8.2f} s {result['requests']:>7} req "
+                  f"{result['pages_per_sec']:>9.1f} pages/s {result['errors']:>5} err {result['blocked']:>5} blocked "
+                  f"{result['redirects']:>5} redirects {result['retries']:>5} retries {result['bypasses']:>5} bypasses {result['peak_rss_mb']:>8.1f} MB peak")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+The mock server is a local aiohttp stand-in for the search engine, built on the recorded pages in benchmarks/fixtures.
+It lets the scraper be load-tested end to end without sending a single request to the real service.
+
+Behaviour of GET /search?q=<query>&start=<offset>:
+
+    * Waits `latency` seconds (plus up to `jitter` seconds) before answering.
+    * With probability `error_rate` answers 500, with probability `blocked_rate` answers the "Google Search" javascript page,
+      and with probability `redirect_rate` answers 302 to https://www.google.com/sorry/index?continue=<original url>.
+    * With `throttle_rate`, every request beyond that many in the last second is also answered with the 302, the way the real service blocks fast clients.
+    * Otherwise serves normal.html with links made unique per (query, page) and a pager that matches `pages`.
+      Offsets past the last page are served empty.html.
+
+GET /sorry/index serves sorry.html and GET /stats returns the request counters as JSON.
+
+Usage:
+
+    python benchmarks/mock_server.py [--port 8080] [--latency 0.05] [--redirect-rate 0.01] [--pages 5]
+
+"""
+
+import os
+import re
+import time
+import random
+import asyncio
+import argparse
+import hashlib
+
+from collections import Counter, deque
+from urllib.parse import quote
+from aiohttp import web
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGER_PATTERN = re.compile(r'<td><a aria-label="Page [0-9]+"[^>]*>[0-9]+</a></td>')
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, f"{name}.html"), "r", encoding="utf-8") as f:
+        return f.read()
+
+class MockSearchServer:
+
+    """
+    The MockSearchServer class holds the configuration, fixtures and counters of the mock search engine and builds its aiohttp application.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts the latency and jitter in seconds, the error, blocked and redirect rates (0..1), the number of result pages per query, a random seed
+              and the requests per second above which every request is redirected (throttle_rate, 0 for no limit).
+
+        2. Application (make_app):
+
+            * Returns an aiohttp Application with the /search, /sorry/index and /stats routes.
+
+        3. Counters (stats):
+
+            * Counts requests by outcome (ok, empty, error, blocked, redirect, sorry) so a harness can compare what the server sent with what the scraper reported.
+
+        4. Running (start, stop):
+
+            * Starts the server on the given host and port inside the current event loop, and stops it again.
+
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, blocked_rate=0.0, redirect_rate=0.0, pages=5, seed=None, throttle_rate=0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.blocked_rate = blocked_rate
+        self.redirect_rate = redirect_rate
+        self.pages = pages
+        self.random = random.Random(seed)
+        self.throttle_rate = throttle_rate
+        self.arrivals = deque()
+
+        self.normal = PAGER_PATTERN.sub("", load_fixture("normal"))
+        self.empty = load_fixture("empty")
+        self.blocked = load_fixture("blocked")
+        self.sorry = load_fixture("sorry")
+
+        self.counters = Counter()
+        self.runner = None
+
+    def result_page(self, query, page):
+        token = hashlib.blake2b(f"{query}|{page}".encode("utf-8"), digest_size=4).hexdigest()
+        pager = "".join(
+            f'<td><a aria-label="Page {num}" class="fl" href="/search?q={quote(query)}&amp;start={(num - 1) * 10}&amp;sa=N">{num}</a></td>'
+            for num in range(1, self.pages + 1) if num != page
+        )
+        body = self.normal.replace(".example.com/", f".{token}.example.com/")
+        return body.replace('<td class="YyVfkd">1</td>', f'<td class="YyVfkd">{page}</td>{pager}', 1)
+
+    def throttled(self):
+        now = time.monotonic()
+        while self.arrivals and now - self.arrivals[0] > 1.0:
+            self.arrivals.popleft()
+        self.arrivals.append(now)
+        return len(self.arrivals) > self.throttle_rate
+
+    async def search(self, request):
+        self.counters["requests"] += 1
+        throttled = self.throttle_rate > 0 and self.throttled()
+        await asyncio.sleep(self.latency + self.random.uniform(0, self.jitter))
+
+        query = request.query.get("q", "")
+        start = int(request.query.get("start", 0) or 0)
+        page = start // 10 + 1
+        roll = self.random.random()
+
+        if roll < self.error_rate:
+            self.counters["error"] += 1
+            return web.Response(status=500, text="Server Error")
+
+        roll -= self.error_rate
+        if roll < self.blocked_rate:
+            self.counters["blocked"] += 1
+            return web.Response(text=self.blocked, content_type="text/html")
+
+        roll -= self.blocked_rate
+        if throttled or roll < self.redirect_rate:
+            self.counters["redirect"] += 1
+            location = f"https://www.google.com/sorry/index?continue={quote(str(request.url), safe='')}"
+            return web.Response(status=302, headers={"Location": location})
+
+        if page > self.pages:
+            self.counters["empty"] += 1
+            return web.Response(text=self.empty, content_type="text/html")
+
+        self.counters["ok"] += 1
+        return web.Response(text=self.result_page(query, page), content_type="text/html")
+
+    async def sorry_page(self, request):
+        self.counters["sorry"] += 1
+        return web.Response(text=self.sorry, content_type="text/html")
+
+    async def stats(self, request):
+        return web.json_response(dict(self.counters))
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_get("/search", self.search)
+        app.router.add_get("/sorry/index", self.sorry_page)
+        app.router.add_get("/stats", self.stats)
+        return app
+
+    async def start(self, host="127.0.0.1", port=0):
+        self.runner = web.AppRunner(self.make_app())
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+def main():
+    parser = argparse.ArgumentParser(prog="mock_server")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on (default: 8080)")
+    parser.add_argument("--latency", type=float, default=0.05, help="base response latency in seconds (default: 0.05)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="extra random latency in seconds (default: 0.02)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500 responses (default: 0)")
+    parser.add_argument("--blocked-rate", type=float, default=0.0, help="share of javascript 'Google Search' pages (default: 0)")
+    parser.add_argument("--redirect-rate", type=float, default=0.0, help="share of 302 redirects to /sorry/index (default: 0)")
+    parser.add_argument("--pages", type=int, default=5, help="result pages per query (default: 5)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="redirect every request beyond this many per second to /sorry/index (default: 0, off)")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for reproducible runs")
+    args = parser.parse_args()
+
+    server = MockSearchServer(args.latency, args.jitter, args.error_rate, args.blocked_rate, args.redirect_rate, args.pages, args.seed, args.throttle_rate)
+    web.run_app(server.make_app(), host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+The resume check kills a real run with SIGKILL in the middle of its dorks, resumes it with --resume and verifies the journal
+against the report, using the local mock search server (benchmarks/mock_server.py) instead of the real service.
+
+It checks that:
+
+    * After the kill, every page marked "ok" in the journal has its results in the report, so --resume never skips a page whose results were lost.
+    * After the resume, every page of every dork has its results in the report and no link is reported twice.
+
+Usage:
+
+    python benchmarks/resume_check.py [--dorks 40] [--pages 5] [--concurrency 4] [--kill-after 60] [--keep]
+
+The scraper runs in a child process with its output sent to /dev/null. The reports of the run are written under the usual
+reports directory with a run id starting with resume-check and removed at the end unless --keep is given.
+
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import asyncio
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from mock_server import MockSearchServer
+from godork.helpers.reports import reports_dir
+from godork.helpers.checkpoint import PAGE_OK
+
+def run_paths(run_id):
+    base_dir = reports_dir()
+    return {
+        "log": f"{base_dir}/logs/{run_id}_godork.log",
+        "report": f"{base_dir}/json/{run_id}_godork.ndjson",
+        "metrics": f"{base_dir}/metrics/{run_id}_godork.json",
+        "journal": f"{base_dir}/journal/{run_id}_godork.journal",
+    }
+
+def read_lines(filename):
+    if not os.path.isfile(filename):
+        return []
+
+    records = []
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # The last line of a killed run may be cut short
+                continue
+    return records
+
+def journaled_pages(run_id):
+    return {(record["query"], record["page"]) for record in read_lines(run_paths(run_id)["journal"]) if record.get("status") == PAGE_OK}
+
+def reported_pages(run_id):
+    pages = {}
+    for record in read_lines(run_paths(run_id)["report"]):
+        if "page" in record:
+            pages.setdefault((record["query"], record["page"]), []).extend(result["link"] for result in record["data_output"])
+    return pages
+
+async def child(args):
+    from godork.services.scrape import Scraper
+
+    server = MockSearchServer(latency=args.latency, jitter=args.latency, pages=args.pages, seed=1)
+    port = await server.start()
+
+    try:
+        scraper = Scraper(
+            dorks=args.dork_file,
+            proxy=None,
+            debug=False,
+            retries=3,
+            max_retries=2,
+            headless_mode=True,
+            concurrency=args.concurrency,
+            backoff=0.05,
+            metrics_interval=0,
+            resume=args.run_id if args.resume else None,
+            run_id=None if args.resume else args.run_id,
+        )
+        scraper.base_url = f"http://127.0.0.1:{port}/search"
+        await scraper.run_with_async()
+    finally:
+        await server.stop()
+
+def spawn(args, dork_file, resume=False):
+    command = [
+        sys.executable, os.path.abspath(__file__), "--child",
+        "--run-id", args.run_id, "--dork-file", dork_file,
+        "--pages", str(args.pages), "--concurrency", str(args.concurrency), "--latency", str(args.latency),
+    ]
+    if resume:
+        command.append("--resume")
+    return subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def check(args):
+    failures = []
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write("\n".join(f"intitle:index.of resume-{num}" for num in range(args.dorks)))
+        dork_file = f.name
+
+    try:
+        process = spawn(args, dork_file)
+        deadline = time.monotonic() + args.timeout
+        while len(journaled_pages(args.run_id)) < args.kill_after and process.poll() is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        if process.poll() is not None:
+            failures.append(f"the run ended before {args.kill_after} pages were journaled, raise --dorks or lower --kill-after")
+        process.send_signal(signal.SIGKILL)
+        process.wait()
+
+        journaled = journaled_pages(args.run_id)
+        reported = reported_pages(args.run_id)
+        lost = sorted(journaled - set(reported))
+        print(f"killed: {len(journaled)} pages journaled as ok, {len(reported)} pages in the report, {len(lost)} journaled pages missing from the report")
+        if lost:
+            failures.append(f"{len(lost)} pages were journaled as ok without their results, e.g. {lost[0]}")
+
+        process = spawn(args, dork_file, resume=True)
+        try:
+            process.wait(timeout=args.timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            failures.append(f"the resumed run did not finish within {args.timeout:g}s")
+
+        reported = reported_pages(args.run_id)
+        expected = {(f"intitle:index.of resume-{num}", page) for num in range(args.dorks) for page in range(1, args.pages + 1)}
+        missing = sorted(page for page in expected if not reported.get(page))
+        links = [link for page_links in reported.values() for link in page_links]
+        duplicates = len(links) - len(set(links))
+        print(f"resumed: {len(expected) - len(missing)}/{len(expected)} pages with results, {len(links)} links, {duplicates} duplicates")
+        if missing:
+            failures.append(f"{len(missing)} pages have no results in the report, e.g. {missing[0]}")
+        if duplicates:
+            failures.append(f"{duplicates} links were reported more than once")
+    finally:
+        os.unlink(dork_file)
+        if not args.keep:
+            for filename in run_paths(args.run_id).values():
+                if os.path.isfile(filename):
+                    os.unlink(filename)
+
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(prog="resume_check")
+    parser.add_argument("--dorks", type=int, default=40, help="number of dorks (default: 40)")
+    parser.add_argument("--pages", type=int, default=5, help="result pages per dork (default: 5)")
+    parser.add_argument("--concurrency", type=int, default=4, help="scraper --concurrency (default: 4)")
+    parser.add_argument("--latency", type=float, default=0.02, help="base response latency of the mock server in seconds (default: 0.02)")
+    parser.add_argument("--kill-after", type=int, default=60, help="journaled pages after which the run is killed (default: 60)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds each run may take (default: 120)")
+    parser.add_argument("--run-id", default=f"resume-check-{os.getpid()}", help="run id of the checked run")
+    parser.add_argument("--keep", action="store_true", help="keep the reports of the run")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--dork-file", help=argparse.SUPPRESS)
+    parser.add_argument("--resume", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        asyncio.run(child(args))
+        return
+
+    failures = check(args)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
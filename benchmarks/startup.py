@@ -0,0 +1,86 @@
+"""
+The startup benchmark measures how long `import godork.godork` takes with `python -X importtime` and checks it against a budget.
+It also verifies that the HTTP-only path does not load the browser or audio stack, which is only needed by the CAPTCHA fallback.
+
+Usage:
+
+    python benchmarks/startup.py [--runs 5] [--budget-ms 500]
+
+The median of all runs is compared with the budget. The script exits with status 1 if the budget is exceeded or a lazy dependency was imported eagerly.
+Measured on Python 3.11 while this budget was set: ~340 ms, almost all of it aiohttp. The browser/audio stack adds ~560 ms more when imported.
+
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+LAZY_MODULES = [
+    "selenium",
+    "undetected_chromedriver",
+    "webdriver_manager",
+    "pydub",
+    "speech_recognition",
+    "bs4",
+    "psutil",
+    "requests",
+]
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+
+def import_time(module):
+    """
+    This function imports a module in a fresh interpreter and returns its cumulative import time in milliseconds and the set of top-level packages that were loaded.
+    """
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.getenv("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True
+    )
+
+    total = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        loaded.add(name.strip().split(".")[0])
+        if name.strip() == module:
+            total = int(cumulative) / 1000
+
+    return total, loaded
+
+def main():
+    parser = argparse.ArgumentParser(prog="startup")
+    parser.add_argument("--module", default="godork.godork", help="module to import (default: godork.godork)")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreters to measure (default: 5)")
+    parser.add_argument("--budget-ms", type=float, default=500, help="maximum median import time in ms (default: 500)")
+    args = parser.parse_args()
+
+    timings = []
+    eager = set()
+    for _ in range(args.runs):
+        total, loaded = import_time(args.module)
+        timings.append(total)
+        eager |= loaded & set(LAZY_MODULES)
+
+    median = statistics.median(timings)
+    print(f"{args.module}: median {median:.1f} ms, min {min(timings):.1f} ms, max {max(timings):.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if eager:
+        print(f"eagerly imported: {', '.join(sorted(eager))}")
+        failed = True
+    if median > args.budget_ms:
+        print("startup budget exceeded")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,6 @@ setup(
     packages=find_packages(where='src'),
     package_dir={'godork': 'src/godork'},
     install_requires=[
-        'bs4',
         'rich',
         'pydub',
         'psutil',
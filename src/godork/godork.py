@@ -3,17 +3,20 @@
 import asyncio
 
 from .utils.colors import Bgcolor
+from .utils.exceptions import GodorkException
 from .helpers.console import Console
 from .helpers.options import OptionParser
+from .helpers.output import setup_output
 from .services.version import check_version
 from .services.scrape import Scraper
 
 def main():
-    check_version()
-
     args = OptionParser.argument_parser()
+    setup_output(args.output)
+
+    check_version(enabled=not args.no_update_check)
 
-    if len(args.dorks) < 1:
+    if len(args.dorks) < 1 and not args.resume:
         print(f"""{Bgcolor.RED}error{Bgcolor.DEFAULT}: the following required arguments were not provided:
   --dorks <DORKS>
               
@@ -22,19 +25,56 @@ usage: godork --dorks <DORKS>
 For more information, try 'godork --help'""")
         return
     
-    scrape = Scraper(
-        dorks=args.dorks,  
+    options = dict(
+        dorks=args.dorks,
         proxy=args.proxy,
         debug=args.debug,
         retries=args.retries,
-        max_retries=args.max_retries, 
-        headless_mode=args.no_headless
+        max_retries=args.max_retries,
+        headless_mode=args.no_headless,
+        concurrency=args.concurrency,
+        log_format=args.log_format,
+        browsers=args.browsers,
+        browser_max_uses=args.browser_max_uses,
+        browser_max_memory=args.browser_max_memory,
+        driver_path=args.driver_path,
+        cache=args.cache,
+        cache_ttl=args.cache_ttl,
+        cache_size=args.cache_size,
+        dork_retries=args.dork_retries,
+        backoff=args.backoff,
+        dedup=args.dedup,
+        metrics_interval=args.metrics_interval,
+        metrics_file=args.metrics_file,
+        profile=args.profile,
+        profile_memory=args.profile_memory,
+        parse_workers=args.parse_workers,
+        max_body_size=args.max_body_size,
+        rate=args.rate,
+        max_rate=args.max_rate,
+        breaker_threshold=args.breaker_threshold,
+        breaker_cooldown=args.breaker_cooldown,
+        output=args.output
     )
+
+    try:
+        if args.workers > 1:
+            from .services.workers import ShardedRunner
+            scrape = ShardedRunner(options, workers=args.workers, shard=args.shard, resume=args.resume)
+        else:
+            scrape = Scraper(**options, resume=args.resume, shard=args.shard)
+    except GodorkException as err:
+        print(f"{Bgcolor.RED}error{Bgcolor.DEFAULT}: {err}")
+        return
     
     try:
-        asyncio.run(scrape.run_with_async())
+        if args.workers > 1:
+            scrape.run()
+        else:
+            asyncio.run(scrape.run_with_async())
     except KeyboardInterrupt:
-        print(f"\r{Console().text_format('info', msg='We appreciate your use of our tool ;) Goodbye!')}")
+        print(f"\r{Console().text_format('info', msg=f'Resume this run with --resume {scrape.reports.run_id}')}")
+        print(Console().text_format('info', msg='We appreciate your use of our tool ;) Goodbye!'))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
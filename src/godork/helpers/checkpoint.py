@@ -0,0 +1,148 @@
+import os
+import json
+
+from datetime import datetime
+from ..utils.exceptions import GodorkException
+
+# Page states written to the journal. A dork is complete once a "done" record exists for it
+PAGE_OK = "ok"
+PAGE_SKIPPED = "skipped"
+DORK_DONE = "done"
+DORK_FAILED = "failed"
+
+def resolve_run(journal_dir, run):
+    """
+    This function turns the value of --resume into a run id. It accepts a run id, the path of any file of that run or "last" for the most recent journal.
+    """
+
+    if run == "last":
+        journals = sorted(name for name in os.listdir(journal_dir) if name.endswith("_godork.journal")) if os.path.isdir(journal_dir) else []
+        if not journals:
+            raise GodorkException(f"No journal found in {journal_dir}")
+        run = journals[-1]
+
+    run_id = os.path.basename(run).split("_godork")[0]
+
+    if not os.path.isfile(os.path.join(journal_dir, f"{run_id}_godork.journal")):
+        raise GodorkException(f"No journal found for run {run_id} in {journal_dir}")
+
+    return run_id
+
+class Checkpoint:
+
+    """
+    The Checkpoint class keeps a durable progress journal of a run, so an interrupted run can be resumed with --resume instead of starting again from the first dork.
+
+    Key Features:
+
+        1. Journal format:
+
+            * An append-only file of JSON lines under reports/journal/<run_id>_godork.journal, flushed after every record.
+            * The first record holds the run id and the dork source, so a resumed run can reuse a dork file or inline dorks without --dorks.
+              A dork file that no longer exists stops the resume with an error instead of being read as an inline dork.
+            * Every processed page is recorded as (query, page, status), where status is "ok" for a page with results or "skipped" for a page that failed with an HTTP error.
+            * The end of every dork is recorded with status "done" (last page reached, no data or no new links) or "failed" (retries exhausted or an unexpected error) and the reason.
+
+        2. Resuming (load):
+
+            * Reads the journal of an earlier run. Dorks with a "done" record are skipped, and every other dork continues from the page after its last recorded page.
+            * Failed dorks are retried from the page that failed, so a run that was blocked can be resumed later.
+            * Only the state of dorks that appear in the journal is kept in memory.
+
+        3. Recording (page, finish):
+
+            * Appends the records for the current run. Records of a resumed run are appended to the same journal.
+            * Every record is one short line written with a single flush.
+            * When a commit callable is given, the page and dork records are handed to it instead of being written directly. The Scraper uses it to
+              write them through the report writer once the results before them are on disk, and the workers of a --workers run to forward them to the parent.
+
+    """
+
+    def __init__(self, filename, commit=None):
+        self.filename = filename
+        self.commit = commit
+        self.file = None
+        self.source = None
+        self.source_file = False
+        self.done = set()
+        self.next_page = {}
+
+    def load(self):
+        with open(self.filename, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # The last line of a killed run may be cut short
+                    continue
+
+                query = record.get("query")
+                status = record.get("status")
+
+                if query is None and "dorks" in record:
+                    self.source = record["dorks"]
+                    self.source_file = record.get("dorks_file", False)
+                elif status == DORK_DONE:
+                    self.done.add(query)
+                    self.next_page.pop(query, None)
+                elif status in (PAGE_OK, PAGE_SKIPPED):
+                    self.next_page[query] = max(self.next_page.get(query, 1), record["page"] + 1)
+
+        return self
+
+    def open(self, source=None, header=True):
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        new_run = not os.path.isfile(self.filename)
+
+        self.file = open(self.filename, "a", encoding="utf-8")
+
+        if not header:
+            return
+        if new_run:
+            self.write({
+                "run_id": os.path.basename(self.filename).split("_godork")[0],
+                "dorks": source,
+                "dorks_file": source is not None and os.path.isfile(source),
+                "started": str(datetime.now()),
+            })
+        else:
+            self.write({"resumed": str(datetime.now())})
+
+    def recorded_dorks(self):
+        """
+        This function returns the dork source recorded by the run being resumed, and raises GodorkException when it was a file that no longer exists.
+        """
+
+        if self.source_file and not os.path.isfile(self.source):
+            raise GodorkException(f"The dork file {self.source} of this run no longer exists, pass the dorks again with --dorks")
+
+        return self.source
+
+    def write(self, record):
+        if self.file is not None:
+            self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.file.flush()
+
+    def is_done(self, query):
+        return query in self.done
+
+    def start_page(self, query):
+        return self.next_page.get(query, 1)
+
+    def record(self, record):
+        if self.commit is not None:
+            self.commit(record)
+        else:
+            self.write(record)
+
+    def page(self, query, page, status):
+        self.record({"query": query, "page": page, "status": status})
+
+    def finish(self, query, status, reason):
+        self.next_page.pop(query, None)
+        self.record({"query": query, "status": status, "reason": reason})
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
@@ -0,0 +1,149 @@
+import math
+import json
+import hashlib
+
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote
+
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "mc_cid", "mc_eid",
+    "igshid", "ref_src", "srsltid", "_ga", "_gl", "ved", "usg", "sa", "ei",
+}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def canonicalize_url(url):
+    """
+    This function returns the canonical form of a link used for deduplication: unquoted, without fragment or tracking parameters
+    (utm_* and common click ids), with a lowercase scheme and host and without the default port.
+    """
+
+    try:
+        parts = urlsplit(unquote(url.strip()))
+    except ValueError:
+        # An unclosed IPv6 bracket cannot be split, so the link is compared as it is
+        return url.strip()
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+
+    try:
+        port = parts.port
+    except ValueError:
+        # A port that is not a number (e.g. example.com:80a) keeps the raw netloc
+        host, port = parts.netloc.lower(), None
+
+    if port and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ])
+
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+def fingerprint(url):
+    """
+    This function hashes the canonical form of a link into a 64-bit integer. Storing fingerprints instead of strings keeps the seen-set small.
+    """
+
+    return int.from_bytes(hashlib.blake2b(canonicalize_url(url).encode("utf-8"), digest_size=8).digest(), "big")
+
+class SeenSet:
+
+    """
+    The SeenSet class remembers which links were already reported during the run. It stores one 64-bit fingerprint per canonical link,
+    so memory grows with the number of unique links but not with their length.
+
+    Key Features:
+
+        1. add(url)
+
+            * Returns True if the canonical link was not seen before (and records it), False if it is a duplicate.
+
+        2. len()
+
+            * The number of unique links seen so far.
+
+    """
+
+    def __init__(self):
+        self.fingerprints = set()
+
+    def add(self, url):
+        value = fingerprint(url)
+        if value in self.fingerprints:
+            return False
+        self.fingerprints.add(value)
+        return True
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+class BloomFilter:
+
+    """
+    The BloomFilter class is a fixed-size alternative to SeenSet for very large runs. Its memory is set up front from the expected number of links (capacity)
+    and the accepted false positive rate (error_rate), and it never grows.
+
+    Key Features:
+
+        1. add(url)
+
+            * Same contract as SeenSet.add. A small fraction (about error_rate) of new links may be reported as duplicates, but a duplicate is never reported as new.
+
+        2. Hashing:
+
+            * The k bit positions are derived from one 128-bit blake2b digest of the canonical link through double hashing.
+
+    """
+
+    def __init__(self, capacity=10_000_000, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def add(self, url):
+        digest = hashlib.blake2b(canonicalize_url(url).encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+
+        new = False
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % self.size
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                new = True
+
+        if new:
+            self.count += 1
+        return new
+
+    def __len__(self):
+        return self.count
+
+def make_seen_set(mode):
+    """
+    This function returns the deduplication stage for a --dedup mode: a SeenSet for "exact", a BloomFilter for "bloom", or None when deduplication is "off".
+    """
+
+    if mode == "exact":
+        return SeenSet()
+    if mode == "bloom":
+        return BloomFilter()
+    return None
+
+def restore_seen(seen, filename):
+    """
+    This function loads the links of an existing NDJSON report into a seen-set, so a resumed run does not report them again.
+    """
+
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            for result in record.get("data_output", ()):
+                seen.add(result["link"])
@@ -1,20 +1,124 @@
 import re
+import html as htmllib
+
+from operator import itemgetter
 
-from ..utils.colors import Bgcolor
 from ..utils.parse import no_data
-from .console import Console
 from ..utils.exceptions import GodorkNoData
 
 from urllib.parse import urlparse, unquote
 from datetime import datetime
-from bs4 import BeautifulSoup
+
+# Every pattern is compiled once at import time. TOKEN_SOURCES hold one pattern per kind of token the scraper needs
+# from a result page. Each starts with a literal prefix, so scanning them one by one and merging the tokens by position
+# is about twice as fast as a single alternation, which has to try every branch at every offset.
+TOKEN_SOURCES = (
+    r'<title>(?P<page_title>.*?)</title>',
+    r'href=\"/url\?q=(?P<link>[^\"&]*)',
+    r'&amp;url=(?P<alt_link>[^\"&]*)&amp;ved=',
+    r'<h3[^>]*>(?P<title>.*?)</h3>',
+    r'aria-label=\"Page (?P<page>[0-9]+)\"',
+)
+TOKEN_PATTERNS = [re.compile(source, re.S) for source in TOKEN_SOURCES]
+# The same tokens on raw UTF-8 bytes, so a response buffer is scanned without decoding the whole page first
+TOKEN_BYTES_PATTERNS = [re.compile(source.encode("ascii"), re.S) for source in TOKEN_SOURCES]
+UTF8_ENCODINGS = {"utf-8", "utf8", "ascii", "us-ascii"}
+PAGES_PATTERN = re.compile(r'aria-label=\"Page ([0-9]+)\"')
+TITLE_PATTERN = re.compile(r'<h3[^>]*>(.*?)</h3>', re.S)
+LINK_PATTERN = re.compile(
+    r'\"><a href=\"\/url\?q=(.*?)&amp|href=\"/url\?q=(.*?)&amp;sa=U&amp;ved=|&amp;url=(.*?)&amp;ved='
+)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+EXCLUDE_TITLE_PATTERN = re.compile(r'Google Search Console|Google Search')
+EXCLUDE_DOMAIN_PATTERN = re.compile(r'[a-zA-Z0-9\-.]+\.google\.com')
+
+def clean_title(raw):
+    """
+    This function removes the inner tags of a title, decodes HTML entities and returns the plain text. Titles that belong to Google itself return None.
+    """
+
+    text = htmllib.unescape(TAG_PATTERN.sub("", raw)).strip()
+    if not text or EXCLUDE_TITLE_PATTERN.search(text):
+        return None
+    return text
+
+def clean_link(raw):
+    """
+    This function validates a raw link taken from a result. Only http(s) links that do not point to a Google domain are kept and returned unquoted.
+    """
+
+    if not raw.startswith(('http', 'https')):
+        return None
+    if EXCLUDE_DOMAIN_PATTERN.fullmatch(urlparse(raw).netloc):
+        return None
+    return unquote(raw)
+
+def decode_token(token):
+    return token.decode("utf-8", errors="replace")
+
+def parse_page(html):
+    """
+    This function scans a result page and returns everything the scraper needs from it: the page <title>, the last known page and
+    a list of results where each title is paired with the link of the anchor that contains it. Tokens are processed in document order.
+    The page may be text or a UTF-8 bytes-like buffer; for a buffer only the matched tokens are decoded.
+    """
+
+    if isinstance(html, str):
+        patterns, decode = TOKEN_PATTERNS, str
+    else:
+        patterns, decode = TOKEN_BYTES_PATTERNS, decode_token
+
+    page_title = None
+    last_page = None
+    results = []
+    seen_links = set()
+    pending_link = None
+
+    tokens = [(match.start(), match.lastgroup, match.group(match.lastgroup)) for pattern in patterns for match in pattern.finditer(html)]
+    tokens.sort(key=itemgetter(0))
+
+    for _, kind, value in tokens:
+        if kind == "title":
+            title = clean_title(decode(value))
+            if title is not None and pending_link is not None:
+                if pending_link not in seen_links:
+                    seen_links.add(pending_link)
+                    results.append({"title": title, "link": pending_link})
+                pending_link = None
+
+        elif kind == "link" or kind == "alt_link":
+            # A title only pairs with the nearest anchor before it, so a dropped link also clears an older pending one
+            pending_link = clean_link(decode(value))
+
+        elif kind == "page":
+            num = int(value)
+            last_page = num if last_page is None else max(last_page, num)
+
+        elif kind == "page_title" and page_title is None:
+            page_title = decode(value)
+
+    return {
+        "title": page_title,
+        "last_page": last_page,
+        "results": results,
+    }
+
+def parse_bytes(raw, encoding="utf-8"):
+    """
+    This function parses a raw response body. UTF-8 bodies are scanned as bytes, other encodings are decoded first.
+    It is a module-level function so that it can run in a parser process.
+    """
+
+    if encoding.lower() in UTF8_ENCODINGS:
+        return parse_page(raw)
+    return parse_page(bytes(raw).decode(encoding, errors="replace"))
 
 def extract_pages(html):
     """
     This function will use a pattern to extract each available page and will return the last page.
     """
 
-    pages = re.findall(r'aria-label=\"Page ([0-9]+)\"', html)
+    pages = PAGES_PATTERN.findall(html)
     return pages[-1]
 
 def extract_title(html):
@@ -23,68 +127,64 @@ def extract_title(html):
     """
 
     data_title = []
-    soup = BeautifulSoup(html, "html.parser")
 
-    for title in soup.find_all("h3"):
-        if not re.search("Google Search Console|Google Search", title.getText()):
-            data_title.append(title.getText().strip())
-    
+    for raw in TITLE_PATTERN.findall(html):
+        title = clean_title(raw)
+        if title is not None:
+            data_title.append(title)
+
     return data_title
 
 def extract_link(text):
     """
-    This function extracts all available links from the search results by applying various patterns to assist in the extraction. 
+    This function extracts all available links from the search results by applying various patterns to assist in the extraction.
     It also checks if a domain is part of the excluded domains list. The function returns a list of links.
     """
 
     data_links = []
-    exclude_domains = re.findall(r'https?://([a-zA-Z0-9\-.]+\.google\.com)', text)
-
-    pattern = re.compile(
-        r'\"><a href=\"\/url\?q=(.*?)&amp|href=\"/url\?q=(.*?)&amp;sa=U&amp;ved=|&amp;url=(.*?)&amp;ved='
-    )
-
-    links = pattern.findall(text)
-    if links:
-        for link in links:
-            link = "".join(list(dict.fromkeys(link)))
-            if link.startswith(('http', 'https')) and urlparse(link).netloc not in exclude_domains:
-                data_links.append(unquote(link))
-    
+
+    for groups in LINK_PATTERN.findall(text):
+        link = clean_link("".join(dict.fromkeys(groups)))
+        if link is not None:
+            data_links.append(link)
+
     return data_links
 
-def extract_data(html, reports, metadata):
+def extract_data(html, reports, metadata, page=None, seen=None, output=None):
     """
-    This function combines title and link extraction to process the data. If both the title and link are valid, they will be printed. 
-    Additionally, the function generates a report if valid data is found.
+    This function processes the paired title and link records of a page. If valid records are found, they are written to the given ResultWriter.
+    Additionally, the function generates a report if valid data is found. An already parsed page can be passed to skip parsing, and the parsed page is returned.
+    When a run-wide seen-set is given, links reported earlier in the run are dropped from the output and the report, and the page gets "new" and "duplicates" counts.
     """
 
     query = metadata.get("query")
     num_page = metadata.get("num_page")
 
-    data_title = extract_title(html)
-    data_links = extract_link(html)
+    if page is None:
+        page = parse_page(html)
 
-    if no_data(data_title) == True:
+    results = page["results"]
+
+    if no_data(results) == True:
         raise GodorkNoData(f"No data can be collected on page {num_page}")
-        
-    if len(data_title) > 0 and len(data_links) > 0:
-        reports.logs_report("info", data=f"Found {len(data_title)} title and {len(data_links)} links on page {num_page}")
-        Console().log_print("info", msg=f"Found {len(data_title)} title and {len(data_links)} links on page {num_page}")
-
-        reports.json_report({
-            "timestamp": str(datetime.now()),
-            "query": query,
-            "page": num_page,
-            "size_page": len(html),
-            "data_output": {
-                "title": data_title,
-                "links": data_links
-            },
-        })
-
-        for i, title in enumerate(data_title):
-            try:
-                print(f"{title} [{Bgcolor.GREEN}{data_links[i]}{Bgcolor.DEFAULT}]")
-            except IndexError:
-                pass
\ No newline at end of file
+
+    new_results = results if seen is None else [result for result in results if seen.add(result["link"])]
+    page["new"] = len(new_results)
+    page["duplicates"] = len(results) - len(new_results)
+
+    reports.logs_report("info", data=f"Found {len(results)} results on page {num_page} ({page['new']} new, {page['duplicates']} duplicates)")
+
+    reports.json_report({
+        "timestamp": str(datetime.now()),
+        "query": query,
+        "page": num_page,
+        "size_page": len(html),
+        "new": page["new"],
+        "duplicates": page["duplicates"],
+        "data_output": new_results,
+    })
+
+    if output is not None:
+        output.write(new_results, query, num_page)
+
+    return page
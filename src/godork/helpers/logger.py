@@ -0,0 +1,146 @@
+import re
+import sys
+import json
+import time
+import logging
+
+from datetime import datetime
+from ..utils.colors import Bgcolor
+
+LOGGER_NAME = "godork"
+
+LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+LABELS = {
+    logging.DEBUG: ("DBUG", "PURPLE"),
+    logging.INFO: ("INFO", "BLUE"),
+    logging.WARNING: ("WARN", "WARNING"),
+    logging.ERROR: ("EROR", "RED"),
+}
+
+ANSI_PATTERN = re.compile(r'\033\[[0-9;]*m')
+
+class ReportHandler(logging.Handler):
+
+    """
+    The ReportHandler class is the single logging handler shared by the log file and the console.
+    Each record is formatted once and the result is written to both outputs, so an event no longer needs one call for the file and another for the terminal.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts the log filename, the minimum level shown on the console, the console stream and the file format ("text" or "json").
+            * The log file is opened lazily on the first record with a large write buffer and kept open for the whole run.
+            * When a sink is given (a callable taking one line), file lines are passed to it instead. Worker processes use it to forward their log to the parent.
+
+        2. emit(record)
+
+            * Builds the message and the timestamp once per record. The timestamp string is cached and only rebuilt when the second changes.
+            * Writes a coloured line to the console when the record reaches console_level, and a plain text line (ANSI codes stripped) or a JSON object to the file.
+
+        3. Flushing:
+
+            * The file is flushed once max_buffer bytes are pending, once flush_interval seconds have passed since the last flush, for every error record, and on close().
+
+    """
+
+    def __init__(self, filename, console_level=logging.INFO, stream=None, log_format="text", max_buffer=64 * 1024, flush_interval=1.0, sink=None):
+        super().__init__(logging.DEBUG)
+        self.filename = filename
+        self.sink = sink
+        self.console_level = console_level
+        self.stream = stream
+        self.json_format = log_format == "json"
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+
+        self.file = None
+        self.pending = 0
+        self.last_flush = time.monotonic()
+
+        self._second = None
+        self._log_time = None
+
+    def log_time(self, created):
+        second = int(created)
+        if second != self._second:
+            self._second = second
+            self._log_time = datetime.fromtimestamp(second).strftime('%Y/%m/%d %H:%M:%S')
+        return self._log_time
+
+    def emit(self, record):
+        try:
+            msg = record.getMessage()
+            log_time = self.log_time(record.created)
+            label, color = LABELS.get(record.levelno, ("INFO", "BLUE"))
+
+            if record.levelno >= self.console_level:
+                text = f"{Bgcolor.GRAY}{msg}{Bgcolor.DEFAULT}" if record.levelno == logging.DEBUG else msg
+                stream = self.stream or sys.stdout
+                stream.write(f"[{Bgcolor.CYAN}{log_time}{Bgcolor.DEFAULT}] [{getattr(Bgcolor, color)}{label}{Bgcolor.DEFAULT}] {text}\n")
+
+            if self.json_format:
+                line = json.dumps({
+                    "time": log_time,
+                    "level": record.levelname.lower(),
+                    "message": ANSI_PATTERN.sub("", msg),
+                }, ensure_ascii=False) + "\n"
+            else:
+                line = f"[{log_time}] [{label}] {ANSI_PATTERN.sub('', msg)}\n"
+
+            self.write(line, force_flush=record.levelno >= logging.ERROR)
+        except Exception:
+            self.handleError(record)
+
+    def write(self, line, force_flush=False):
+        if self.sink is not None:
+            self.sink(line)
+            return
+
+        with self.lock:
+            if self.file is None:
+                self.file = open(self.filename, "at", encoding="utf-8", buffering=self.max_buffer)
+
+            self.file.write(line)
+            self.pending += len(line)
+
+            if force_flush or self.pending >= self.max_buffer or time.monotonic() - self.last_flush >= self.flush_interval:
+                self.file.flush()
+                self.pending = 0
+                self.last_flush = time.monotonic()
+
+    def flush(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.flush()
+                self.pending = 0
+                self.last_flush = time.monotonic()
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+        super().close()
+
+def setup_logger(filename, debug=False, log_format="text", stream=None, sink=None):
+    """
+    This function configures the shared "godork" logger once per process and returns it. The logger level is set before anything is
+    formatted, so debug records are dropped at the call site unless --debug is enabled.
+    """
+
+    logger = logging.getLogger(LOGGER_NAME)
+
+    if not logger.handlers:
+        level = logging.DEBUG if debug else logging.INFO
+        logger.setLevel(level)
+        logger.propagate = False
+        logger.addHandler(ReportHandler(filename, console_level=level, stream=stream, log_format=log_format, sink=sink))
+
+    return logger
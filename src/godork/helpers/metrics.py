@@ -0,0 +1,271 @@
+import os
+import json
+import time
+import asyncio
+import threading
+
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+
+# Upper bounds in seconds. Requests and browser bypasses are slow, parsing and report writes are fast
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+def metric_key(name, labels):
+    return (name, tuple(sorted(labels.items())))
+
+def metric_name(key, prefix=""):
+    name, labels = key
+    if not labels:
+        return f"{prefix}{name}"
+    return prefix + name + "{" + ",".join(f'{label}="{value}"' for label, value in labels) + "}"
+
+class Histogram:
+
+    """
+    The Histogram class counts observations in fixed buckets, the way Prometheus histograms do, so recording a value costs one bisect
+    and memory does not grow with the number of requests.
+    """
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """
+        This function returns the upper bound of the bucket that holds the q-quantile, or the largest observation when it falls above the last bucket.
+        """
+
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            if total >= rank:
+                return bound
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": round(self.max, 6),
+        }
+
+class Metrics:
+
+    """
+    The Metrics class is the in-process registry of runtime metrics for one run. It replaces guessing from the final memory print
+    with numbers that can be watched while the scraper is working.
+
+    Key Features:
+
+        1. Recording:
+
+            * count(name, value, **labels) increments a counter, e.g. requests by status class, bytes received, retries, fallbacks or results.
+            * observe(name, value, **labels) records a value in a histogram, e.g. request latency by status class, parse time or browser time.
+            * timer(name, **labels) is a context manager that observes the wall-clock time of its block.
+            * set(name, value, **labels) stores a gauge such as the resident memory of the process.
+            * Every method takes a lock, so the report writer thread and the browser threads can record safely.
+
+        2. Summaries (snapshot):
+
+            * Returns the counters, gauges, histogram summaries (count, sum, avg, p50, p95, max) and rates (pages, results and bytes per second) as a dict.
+
+        3. Exporting:
+
+            * prometheus() renders every metric in the Prometheus text exposition format with a "godork_" prefix.
+            * publish(json_file, prometheus_file) atomically rewrites the JSON summary and, when given, the Prometheus text file
+              (for example in a node_exporter textfile collector directory).
+            * report_every(interval, ...) publishes both files every interval seconds until it is cancelled.
+
+        4. Merging (export, merge):
+
+            * export() returns the raw state (counters, gauges and histogram buckets) as plain lists that can cross a process boundary.
+            * merge(state) adds an exported state to this registry. The --workers runner merges the latest state of every worker into one summary.
+
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.counters = Counter()
+        self.gauges = {}
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def restart(self):
+        self.started = time.monotonic()
+
+    def count(self, name, value=1, **labels):
+        with self.lock:
+            self.counters[metric_key(name, labels)] += value
+
+    def set(self, name, value, **labels):
+        with self.lock:
+            self.gauges[metric_key(name, labels)] = value
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS, **labels):
+        key = metric_key(name, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, buckets=LATENCY_BUCKETS, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, buckets=buckets, **labels)
+
+    def total(self, name):
+        with self.lock:
+            return sum(value for (key, _), value in self.counters.items() if key == name)
+
+    def update_memory(self):
+        try:
+            import psutil
+            self.set("memory_rss_bytes", psutil.Process(os.getpid()).memory_info().rss)
+        except Exception:
+            pass
+
+    def export(self):
+        with self.lock:
+            return {
+                "counters": [[name, list(labels), value] for (name, labels), value in self.counters.items()],
+                "gauges": [[name, list(labels), value] for (name, labels), value in self.gauges.items()],
+                "histograms": [
+                    [name, list(labels), list(histogram.buckets), histogram.counts, histogram.count, histogram.sum, histogram.max]
+                    for (name, labels), histogram in self.histograms.items()
+                ],
+            }
+
+    def merge(self, state):
+        with self.lock:
+            for name, labels, value in state["counters"]:
+                self.counters[(name, tuple(map(tuple, labels)))] += value
+
+            for name, labels, value in state["gauges"]:
+                key = (name, tuple(map(tuple, labels)))
+                self.gauges[key] = self.gauges.get(key, 0) + value
+
+            for name, labels, buckets, counts, count, total, maximum in state["histograms"]:
+                key = (name, tuple(map(tuple, labels)))
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = self.histograms[key] = Histogram(buckets)
+                histogram.counts = [a + b for a, b in zip(histogram.counts, counts)]
+                histogram.count += count
+                histogram.sum += total
+                histogram.max = max(histogram.max, maximum)
+
+    def snapshot(self):
+        uptime = time.monotonic() - self.started
+        pages = self.total("pages")
+        results = self.total("results")
+        received = self.total("bytes_received")
+
+        with self.lock:
+            return {
+                "uptime": round(uptime, 3),
+                "counters": {metric_name(key): value for key, value in sorted(self.counters.items())},
+                "gauges": {metric_name(key): value for key, value in sorted(self.gauges.items())},
+                "histograms": {metric_name(key): histogram.summary() for key, histogram in sorted(self.histograms.items())},
+                "rates": {
+                    "pages_per_sec": round(pages / uptime, 3) if uptime else 0.0,
+                    "results_per_sec": round(results / uptime, 3) if uptime else 0.0,
+                    "bytes_per_sec": round(received / uptime, 3) if uptime else 0.0,
+                },
+            }
+
+    def describe(self, snapshot):
+        """
+        This function returns the one-line summary of a snapshot that is logged at the end of a run.
+        """
+
+        with self.lock:
+            latency = [histogram for (name, _), histogram in self.histograms.items() if name == "request_seconds"]
+            p95 = max((histogram.quantile(0.95) for histogram in latency), default=0.0)
+        browser_time = snapshot["histograms"].get("browser_seconds", {}).get("sum", 0.0)
+
+        return (
+            f"Metrics: {self.total('requests')} requests (p95 {p95}s), {self.total('pages')} pages, "
+            f"{self.total('results')} results ({snapshot['rates']['results_per_sec']}/s), {self.total('retries')} retries, "
+            f"{self.total('fallbacks')} fallbacks, {browser_time:.1f}s in the browser"
+        )
+
+    def prometheus(self, prefix="godork_"):
+        lines = []
+
+        with self.lock:
+            for name in sorted({key[0] for key in self.counters}):
+                lines.append(f"# TYPE {prefix}{name}_total counter")
+                for key, value in sorted(self.counters.items()):
+                    if key[0] == name:
+                        lines.append(f"{metric_name((f'{name}_total', key[1]), prefix)} {value}")
+
+            for name in sorted({key[0] for key in self.gauges}):
+                lines.append(f"# TYPE {prefix}{name} gauge")
+                for key, value in sorted(self.gauges.items()):
+                    if key[0] == name:
+                        lines.append(f"{metric_name(key, prefix)} {value}")
+
+            for name in sorted({key[0] for key in self.histograms}):
+                lines.append(f"# TYPE {prefix}{name} histogram")
+                for (key, labels), histogram in sorted(self.histograms.items()):
+                    if key != name:
+                        continue
+                    total = 0
+                    for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                        total += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f"{metric_name((f'{name}_bucket', labels + (('le', le),)), prefix)} {total}")
+                    lines.append(f"{metric_name((f'{name}_sum', labels), prefix)} {histogram.sum}")
+                    lines.append(f"{metric_name((f'{name}_count', labels), prefix)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def publish(self, json_file, prometheus_file=None):
+        """
+        This function writes the current JSON summary and, when a path is given, the Prometheus text file. Both are replaced atomically so readers never see a partial file.
+        """
+
+        self.update_memory()
+        write_atomic(json_file, json.dumps(self.snapshot(), indent=2))
+        if prometheus_file:
+            write_atomic(prometheus_file, self.prometheus())
+
+    async def report_every(self, interval, json_file, prometheus_file=None):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            await loop.run_in_executor(None, self.publish, json_file, prometheus_file)
+
+def write_atomic(path, text):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
@@ -24,6 +24,16 @@ class OptionParser:
 
     """
 
+    @staticmethod
+    def shard(value):
+        try:
+            index, count = (int(part) for part in value.split("/"))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid shard {value!r}, expected i/n (e.g. 0/4)")
+        if count < 1 or not 0 <= index < count:
+            raise argparse.ArgumentTypeError(f"invalid shard {value!r}, expected 0 <= i < n")
+        return index, count
+
     @staticmethod
     def argument_parser():
         parser = argparse.ArgumentParser(
@@ -41,7 +51,7 @@ class OptionParser:
             "--dorks",
             action="store",
             default="",
-            help="single dork or file containing multiple dorks"
+            help="single dork, file containing multiple dorks or - to read them from stdin"
         )
         parser.add_argument(
             "-p",
@@ -63,12 +73,194 @@ class OptionParser:
             default=2,
             help="max attempts to bypass protection mechanisms (default: 2)"
         )
+        parser.add_argument(
+            "--dork-retries",
+            type=int,
+            action="store",
+            default=100,
+            help="total retries allowed across all pages of one dork (default: 100)"
+        )
+        parser.add_argument(
+            "--backoff",
+            type=float,
+            action="store",
+            default=0.5,
+            help="base delay in seconds for exponential backoff between retries (default: 0.5)"
+        )
+        parser.add_argument(
+            "-c",
+            "--concurrency",
+            type=int,
+            action="store",
+            default=1,
+            help="number of dorks to run at the same time (default: 1)"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            action="store",
+            default=1,
+            help="number of worker processes, each running its own share of the dorks (default: 1)"
+        )
+        parser.add_argument(
+            "--shard",
+            type=OptionParser.shard,
+            action="store",
+            default=None,
+            metavar="I/N",
+            help="only run shard i of n (0 <= i < n) to split the same dorks across machines"
+        )
+        parser.add_argument(
+            "--parse-workers",
+            type=int,
+            action="store",
+            default=0,
+            help="processes used to parse result pages when several dorks run at once, 0 parses inline (default: 0)"
+        )
+        parser.add_argument(
+            "--max-body-size",
+            type=int,
+            action="store",
+            default=2048,
+            help="stop reading a response after this many KB, 0 for no limit (default: 2048)"
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            action="store",
+            default=0,
+            help="starting requests per second of the adaptive rate limiter, raised on 200 and halved on blocks, 0 disables it (default: 0)"
+        )
+        parser.add_argument(
+            "--max-rate",
+            type=float,
+            action="store",
+            default=20.0,
+            help="highest requests per second the rate limiter may reach (default: 20)"
+        )
+        parser.add_argument(
+            "--breaker-threshold",
+            type=int,
+            action="store",
+            default=0,
+            help="pause every request after this many consecutive blocks, 0 disables the circuit breaker (default: 0)"
+        )
+        parser.add_argument(
+            "--breaker-cooldown",
+            type=float,
+            action="store",
+            default=60.0,
+            help="seconds requests are paused before one probe request is sent, doubled when the probe is blocked (default: 60)"
+        )
+        parser.add_argument(
+            "--browsers",
+            type=int,
+            action="store",
+            default=1,
+            help="number of warm browsers kept for bypassing (default: 1)"
+        )
+        parser.add_argument(
+            "--browser-max-uses",
+            type=int,
+            action="store",
+            default=20,
+            help="recycle a browser after this many bypasses (default: 20)"
+        )
+        parser.add_argument(
+            "--browser-max-memory",
+            type=int,
+            action="store",
+            default=1024,
+            help="recycle a browser above this memory usage in MB (default: 1024)"
+        )
+        parser.add_argument(
+            "--driver-path",
+            action="store",
+            default=None,
+            help="path to the chromedriver binary (default: $GODORK_CHROMEDRIVER or auto-detected)"
+        )
+        parser.add_argument(
+            "--dedup",
+            choices=["exact", "bloom", "off"],
+            default="exact",
+            help="drop links already reported in this run: exact fingerprints, a fixed-size bloom filter or off (default: exact)"
+        )
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            default=False,
+            help="serve recently fetched result pages from the on-disk response cache"
+        )
+        parser.add_argument(
+            "--cache-ttl",
+            type=int,
+            action="store",
+            default=86400,
+            help="seconds a cached result page stays valid (default: 86400)"
+        )
+        parser.add_argument(
+            "--cache-size",
+            type=int,
+            action="store",
+            default=512,
+            help="maximum size of the response cache in MB (default: 512)"
+        )
+        parser.add_argument(
+            "--resume",
+            action="store",
+            default=None,
+            metavar="RUN",
+            help="resume an interrupted run by its run id (e.g. 2024-01-01-12:00:00) or 'last'"
+        )
+        parser.add_argument(
+            "--metrics-interval",
+            type=float,
+            action="store",
+            default=10.0,
+            help="seconds between runtime metrics summaries in the reports directory, 0 to disable (default: 10)"
+        )
+        parser.add_argument(
+            "--metrics-file",
+            action="store",
+            default=None,
+            help="also write the metrics in Prometheus text format to this file"
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            default=False,
+            help="profile the run with cProfile and time each stage of every page (saved in the reports directory)"
+        )
+        parser.add_argument(
+            "--profile-memory",
+            action="store_true",
+            default=False,
+            help="with --profile, also save a tracemalloc snapshot diff of the run"
+        )
+        parser.add_argument(
+            "--output",
+            choices=["text", "ndjson", "tsv", "plain"],
+            default="text",
+            help="format of the results written to stdout, anything else goes to stderr with ndjson, tsv and plain (default: text)"
+        )
+        parser.add_argument(
+            "--no-update-check",
+            action="store_true",
+            default=False,
+            help="skip the release check (also: GODORK_NO_UPDATE_CHECK=1)"
+        )
         parser.add_argument(
             "--debug",
             action="store_true",
             default=False,
             help="show detailed logs and error for debugging"
         )
+        parser.add_argument(
+            "--log-format",
+            choices=["text", "json"],
+            default="text",
+            help="format of the log file (default: text)"
+        )
         parser.add_argument(
             "--no-headless",
             action="store_false",
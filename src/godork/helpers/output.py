@@ -0,0 +1,92 @@
+import os
+import sys
+import json
+
+from ..utils.colors import Bgcolor
+
+OUTPUT_FORMATS = ("text", "ndjson", "tsv", "plain")
+
+def setup_output(output="text"):
+    """
+    This function prepares the terminal for the chosen --output format. With a machine-readable format stdout only carries results,
+    so everything else printed through sys.stdout (banner, progress and log lines) is sent to stderr. Colours are turned off when the
+    stream that shows the progress is not a terminal.
+    """
+
+    if output != "text":
+        sys.stdout = sys.stderr
+
+    if not sys.stdout.isatty():
+        Bgcolor.disable()
+
+def clean_field(value):
+    return str(value).replace("\t", " ").replace("\r", " ").replace("\n", " ")
+
+class ResultWriter:
+
+    """
+    The ResultWriter class writes the results of every page to stdout in the format chosen with --output.
+
+    Key Features:
+
+        1. Formats:
+
+            * text: the title followed by the link in colour, one result per line (the default, meant for a terminal).
+            * ndjson: one JSON object per result with the query, page, title and link.
+            * tsv: the query, page, title and link separated by tabs. Tabs and line breaks inside a field are replaced by spaces.
+            * plain: only the link, one per line, ready to be piped into other tools.
+
+        2. Buffering:
+
+            * The machine-readable formats write to the original stdout through a block-buffered writer, and all the results of a page
+              are written in one call, so the terminal is no longer written once per result.
+            * When the reader of the pipe goes away (e.g. `| head`), the remaining output is dropped instead of failing the run.
+
+    """
+
+    def __init__(self, output="text", buffer_size=64 * 1024):
+        self.output = output
+
+        if output == "text":
+            self.stream = sys.stdout
+        else:
+            self.stream = open(sys.__stdout__.fileno(), "w", encoding="utf-8", errors="replace", buffering=buffer_size, closefd=False)
+
+    def format(self, result, query, page):
+        if self.output == "ndjson":
+            return json.dumps({"query": query, "page": page, "title": result["title"], "link": result["link"]}, ensure_ascii=False) + "\n"
+        if self.output == "tsv":
+            return f"{clean_field(query)}\t{page}\t{clean_field(result['title'])}\t{result['link']}\n"
+        if self.output == "plain":
+            return f"{result['link']}\n"
+        return f"{result['title']} [{Bgcolor.GREEN}{result['link']}{Bgcolor.DEFAULT}]\n"
+
+    def write(self, results, query=None, page=None):
+        if self.stream is None or not results:
+            return
+
+        try:
+            self.stream.write("".join(self.format(result, query, page) for result in results))
+        except BrokenPipeError:
+            self.drop()
+
+    def drop(self):
+        # Point stdout at devnull so the buffered rest of the output can be flushed without raising again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.__stdout__.fileno())
+        os.close(devnull)
+        self.stream = None
+
+    def close(self):
+        if self.stream is None:
+            return
+
+        try:
+            self.stream.flush()
+        except BrokenPipeError:
+            self.drop()
+            return
+
+        if self.output != "text":
+            self.stream.close()
+        self.stream = None
@@ -0,0 +1,137 @@
+import os
+import io
+import json
+import time
+
+from collections import defaultdict
+from contextlib import nullcontext
+
+NULL_SPAN = nullcontext()
+
+class Span:
+
+    """
+    The Span class records the wall-clock time of one stage (fetch, parse, write or fallback) of one page.
+    """
+
+    __slots__ = ("profiler", "stage", "query", "page", "start")
+
+    def __init__(self, profiler, stage, query, page):
+        self.profiler = profiler
+        self.stage = stage
+        self.query = query
+        self.page = page
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        self.profiler.spans.append((self.stage, self.query, self.page, self.start - self.profiler.started, end - self.start))
+        return False
+
+class Profiler:
+
+    """
+    The Profiler class implements the --profile mode. It answers where the time of a slow run goes: network, parsing, report I/O or the browser.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts whether profiling is enabled, the output directory (reports/profile), the run id used to name the files and whether
+              a tracemalloc snapshot diff should be taken (--profile-memory).
+            * When profiling is disabled every method is a no-op and span() returns a shared null context, so the hot path pays nothing.
+
+        2. start() and stop():
+
+            * start() enables cProfile for the event loop thread and takes the first tracemalloc snapshot.
+            * stop() disables both and writes the files next to the logs:
+
+                - <run_id>_godork.pstats: the raw cProfile statistics, readable with `python -m pstats` or snakeviz
+                - <run_id>_godork.profile.txt: the top functions by cumulative time
+                - <run_id>_godork.spans.ndjson: one line per stage of every page with its start offset and duration in seconds
+                - <run_id>_godork.memory.txt: the allocation sites that grew the most during the run (only with --profile-memory)
+
+            * It returns the total time, number of spans and average duration per stage so the caller can log them.
+
+        3. span(stage, query, page):
+
+            * A context manager that records the wall-clock duration of a stage of one page. Stages overlap when several dorks run at once,
+              so the span totals show where pages wait, not CPU time.
+
+    """
+
+    def __init__(self, enabled=False, output_dir=None, run_id="godork", memory=False):
+        self.enabled = enabled
+        self.output_dir = output_dir
+        self.run_id = run_id
+        self.memory = memory and enabled
+
+        self.spans = []
+        self.started = time.perf_counter()
+        self.profile = None
+        self.snapshot = None
+
+    def span(self, stage, query=None, page=None):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, stage, query, page)
+
+    def path(self, suffix):
+        return os.path.join(self.output_dir, f"{self.run_id}_godork.{suffix}")
+
+    def start(self):
+        if not self.enabled:
+            return
+
+        # The profilers are only imported when --profile is used
+        import cProfile
+        import tracemalloc
+
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        if self.memory:
+            tracemalloc.start(25)
+            self.snapshot = tracemalloc.take_snapshot()
+
+        self.started = time.perf_counter()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop(self):
+        if not self.enabled or self.profile is None:
+            return {}
+
+        import pstats
+        import tracemalloc
+
+        self.profile.disable()
+
+        self.profile.dump_stats(self.path("pstats"))
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats("cumulative").print_stats(40)
+        with open(self.path("profile.txt"), "w", encoding="utf-8") as f:
+            f.write(stream.getvalue())
+        self.profile = None
+
+        if self.memory:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            with open(self.path("memory.txt"), "w", encoding="utf-8") as f:
+                for stat in snapshot.compare_to(self.snapshot, "lineno")[:40]:
+                    f.write(f"{stat}\n")
+            self.snapshot = None
+
+        stages = defaultdict(lambda: {"count": 0, "total": 0.0})
+        with open(self.path("spans.ndjson"), "w", encoding="utf-8") as f:
+            for stage, query, page, start, duration in self.spans:
+                f.write(json.dumps({"stage": stage, "query": query, "page": page, "start": round(start, 6), "duration": round(duration, 6)}, ensure_ascii=False) + "\n")
+                stages[stage]["count"] += 1
+                stages[stage]["total"] += duration
+
+        for stage in stages.values():
+            stage["avg"] = stage["total"] / stage["count"]
+
+        return dict(stages)
@@ -1,8 +1,153 @@
 import os
 import json
+import time
+import queue
+import atexit
+import threading
 
 from datetime import datetime
 from .console import Console
+from .logger import LEVELS, setup_logger
+from .metrics import FAST_BUCKETS
+
+def reports_dir():
+    """
+    This function returns the base directory of the reports, /tmp/godork/reports (or %TEMP%/godork/reports on Windows).
+    """
+
+    temp_dir = os.getenv("TEMP") if os.name == "nt" else "/tmp"
+    return f"{temp_dir}/godork/reports"
+
+class ReportWriter:
+
+    """
+    The ReportWriter class is a streaming sink for newline-delimited JSON (NDJSON) reports.
+    It keeps one buffered file handle open for the whole run and moves serialization and disk I/O to a background thread, so the event loop never waits on a write.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts the target filename, the number of buffered bytes that triggers a flush (max_buffer), the maximum age of unflushed data in seconds (flush_interval)
+              and an optional Metrics registry that receives the number of records, bytes written and the time spent serializing each record.
+            * Nothing is opened or started until the first record is written, so runs without results never create an empty file.
+
+        2. write(data)
+
+            * Puts the record on an unbounded in-memory queue and returns immediately.
+            * The writer thread serializes each record as compact JSON on a single line and appends it to the open handle.
+
+        3. Flushing:
+
+            * The handle is flushed once max_buffer bytes are pending, once flush_interval seconds have passed since the last flush, and on close().
+
+        4. after(callback, *args)
+
+            * Queues a callback that the writer thread runs once every record written before it has been flushed to the file.
+              The checkpoint journal uses it so a page is only marked as done once its results are on disk.
+
+        5. close()
+
+            * Drains the queue, flushes and closes the handle, then joins the writer thread. It is also registered with atexit so that an interrupted run still keeps its buffered records.
+
+    """
+
+    _CLOSE = object()
+
+    class _After:
+        def __init__(self, callback, args):
+            self.callback = callback
+            self.args = args
+
+    def __init__(self, filename, max_buffer=64 * 1024, flush_interval=1.0, metrics=None):
+        self.filename = filename
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+        self.metrics = metrics
+
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self._worker, name="godork-report-writer", daemon=True)
+                    self.thread.start()
+                    atexit.register(self.close)
+
+    def write(self, data):
+        self.start()
+        self.queue.put(data)
+
+    def after(self, callback, *args):
+        self.start()
+        self.queue.put(self._After(callback, args))
+
+    def close(self):
+        with self.lock:
+            thread, self.thread = self.thread, None
+
+        if thread is not None:
+            self.queue.put(self._CLOSE)
+            thread.join()
+            atexit.unregister(self.close)
+
+    def dump(self, f, data):
+        """
+        This function serializes one record and appends it to the open handle f. It returns the number of characters written.
+        """
+
+        start = time.perf_counter()
+        line = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+        f.write(line)
+
+        if self.metrics is not None:
+            self.metrics.observe("report_write_seconds", time.perf_counter() - start, buckets=FAST_BUCKETS)
+            self.metrics.count("report_records")
+            self.metrics.count("report_bytes", len(line))
+
+        return len(line)
+
+    def _worker(self):
+        with open(self.filename, "at", encoding="utf-8", buffering=self.max_buffer) as f:
+            pending = 0
+            last_flush = time.monotonic()
+
+            while True:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush))
+                try:
+                    data = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    data = None
+
+                if data is self._CLOSE:
+                    break
+
+                if isinstance(data, self._After):
+                    try:
+                        if pending:
+                            f.flush()
+                            pending = 0
+                            last_flush = time.monotonic()
+                        data.callback(*data.args)
+                    except Exception as err:
+                        Console().log_print("error", msg=err)
+                    continue
+
+                if data is not None:
+                    try:
+                        pending += self.dump(f, data)
+                    except Exception as err:
+                        Console().log_print("error", msg=err)
+
+                if pending and (pending >= self.max_buffer or time.monotonic() - last_flush >= self.flush_interval):
+                    f.flush()
+                    pending = 0
+                    last_flush = time.monotonic()
+                elif not pending:
+                    last_flush = time.monotonic()
 
 class Reports:
 
@@ -14,7 +159,7 @@ class Reports:
 
         * This class automates the creation, formatting, and saving of:
 
-            - Log files in plain text (human-readable)
+            - Log files in plain text (human-readable) or structured JSON lines
             - JSON reports for structured, machine-readable data
             - Organized directories for persistent reporting
     
@@ -25,30 +170,38 @@ class Reports:
             * Upon initialization:
 
                 - Determines the appropriate temp directory (Windows or Unix-based systems)
-                - Sets up paths for logs and JSON reports using timestamps
-                - Automatically creates required directories (logs and json) under /tmp/godork/reports (or %TEMP%/godork/reports on Windows)
+                - Sets up paths for logs, NDJSON reports, the metrics summary and the progress journal that share one timestamp (run_id)
+                - When the run_id of an earlier run is given (--resume), the same paths are reused and new records are appended to them
+                - Creates a ReportWriter that streams the NDJSON report through one persistent, buffered handle
+                - Automatically creates required directories (logs, json, metrics and journal) under /tmp/godork/reports (or %TEMP%/godork/reports on Windows)
+                - Configures the shared "godork" logger, whose single ReportHandler writes every event to the log file and to the console
                 - Initializes the Console utility for consistent and colored terminal output
 
-        2. write_file_json(filename, data)
+        2. logs_report(status, data, *args)
 
-            * Appends structured data to a JSON file. Ideal for storing detailed metadata or search results.
+            * Emits a log entry with a status level like INFO, ERROR, DEBUG or WARNING. The entry goes to the log file and the console in one call.
+            * Levels below the configured one (debug without --debug) are dropped before any formatting. Extra args are %-formatted only when the entry is kept.
 
-        3. write_file_text(filename, data)
+        3. json_report(data) and after(callback, *args)
 
-            * Appends plain text to a given file. Primarily used for saving logs and console-style outputs.
+            * json_report hands a record to the ReportWriter, which appends it to the report file as one line of compact JSON without blocking the caller.
+            * after runs callback in the writer thread once every record reported before it is on disk.
 
-        4. logs_report(status, data)
+        4. close()
 
-            * Handles writing formatted log entries (with timestamps and status levels like INFO, ERROR, DEBUG) to the log file. Uses the Console class for formatting consistency.
+            * Flushes the log file and flushes and closes the NDJSON report. Called once at the end of the run.
 
-        5. json_report(data)
+        5. Forwarding (sink):
 
-            * Writes a JSON entry to the report file. Useful for capturing individual result items in structured form.
+            * When a sink is given (a callable taking a kind and a payload), log lines are passed to it as ("log", line) and report records as ("record", data)
+              instead of being written to disk. The --workers runner uses it so that every worker process streams into the one report of the parent.
 
     Report Paths:
 
         * Logs: Saved under reports/logs/ with timestamped filenames.
-        * JSON: Saved under reports/json/ for structured result data.
+        * JSON: Saved under reports/json/ as newline-delimited JSON (one record per line) for structured result data.
+        * Metrics: The latest runtime metrics summary is kept under reports/metrics/ and rewritten while the run is in progress.
+        * Journal: The progress journal used by --resume is kept under reports/journal/.
 
     Error Handling:
 
@@ -56,43 +209,51 @@ class Reports:
 
     """
 
-    def __init__(self):
-        self.temp_dir = os.getenv("TEMP") if os.name == "nt" else "/tmp"
-        self.base_dir = f"{self.temp_dir}/godork/reports"
+    def __init__(self, debug=False, log_format="text", metrics=None, run_id=None, sink=None):
+        self.base_dir = reports_dir()
+
+        self.run_id = run_id or str(datetime.now().strftime('%Y-%m-%d-%H:%M:%S'))
+
+        self.log_file = f"{self.base_dir}/logs/{self.run_id}_godork.log"
+        self.json_file = f"{self.base_dir}/json/{self.run_id}_godork.ndjson"
+        self.metrics_file = f"{self.base_dir}/metrics/{self.run_id}_godork.json"
+        self.journal_file = f"{self.base_dir}/journal/{self.run_id}_godork.journal"
 
-        self.log_file = f"{self.base_dir}/logs/{str(datetime.now().strftime('%Y-%m-%d-%H:%M:%S'))}_godork.log"
-        self.json_file = f"{self.base_dir}/json/{str(datetime.now().strftime('%Y-%m-%d-%H:%M:%S'))}_godork.json"
+        os.makedirs(f"{self.base_dir}/logs", exist_ok=True)
+        os.makedirs(f"{self.base_dir}/json", exist_ok=True)
+        os.makedirs(f"{self.base_dir}/metrics", exist_ok=True)
+        os.makedirs(f"{self.base_dir}/journal", exist_ok=True)
 
         self.console = Console()
+        self.sink = sink
+        self.logger = setup_logger(self.log_file, debug=debug, log_format=log_format, sink=(lambda line: sink("log", line)) if sink else None)
+        self.json_writer = ReportWriter(self.json_file, metrics=metrics)
 
+    def logs_report(self, status, data, *args):
         try:
-            os.makedirs(f"{self.base_dir}/logs")
-            os.makedirs(f"{self.base_dir}/json")
-        except FileExistsError:
-            self.base_dir = self.base_dir
-
-    def write_file_json(self, filename, data):
-        with open(filename, "at") as f:
-            try:
-                f.write(json.dumps(data, indent=4, ensure_ascii=False) + os.linesep)
-            finally:
-                f.close()
-
-    def write_file_text(self, filename, data):
-        with open(filename, "at") as f:
-            try:
-                f.write(str(data) + os.linesep)
-            finally:
-                f.close()
-
-    def logs_report(self, status, data):
-        try:
-            self.write_file_text(self.log_file, data=self.console.out_log_format(status, msg=data))
+            self.logger.log(LEVELS[status.lower()], data, *args)
         except Exception as err:
             self.console.log_print("error", msg=err)
 
     def json_report(self, data):
         try:
-            self.write_file_json(self.json_file, data=data)
+            if self.sink is not None:
+                self.sink("record", data)
+            else:
+                self.json_writer.write(data)
+        except Exception as err:
+            self.console.log_print("error", msg=err)
+
+    def after(self, callback, *args):
+        try:
+            self.json_writer.after(callback, *args)
+        except Exception as err:
+            self.console.log_print("error", msg=err)
+
+    def close(self):
+        try:
+            for handler in self.logger.handlers:
+                handler.flush()
+            self.json_writer.close()
         except Exception as err:
             self.console.log_print("error", msg=err)
\ No newline at end of file
@@ -0,0 +1,149 @@
+import time
+import asyncio
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+class CircuitBreaker:
+
+    """
+    The CircuitBreaker class is shared by every dork of a run. When the provider starts blocking, the requests behind the first blocked one
+    are usually blocked too, so instead of letting each of them run its own retries and browser fallback, the breaker pauses them all.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts the number of consecutive block signals that opens the circuit (--breaker-threshold), the cooldown in seconds (--breaker-cooldown)
+              and the longest cooldown. Reports and Metrics are optional.
+
+        2. States:
+
+            * closed: requests go through. Every block signal (a redirect to the /sorry page or the javascript "Google Search" page) is counted,
+              and a page with results resets the count.
+            * open: after `threshold` consecutive block signals. acquire() makes every request wait until the cooldown has passed.
+            * half-open: the first request after the cooldown is the probe and the others keep waiting. If the probe (or the browser fallback it is
+              allowed to run) gets results, the circuit is closed and every waiting request resumes. If it is blocked again, the circuit opens
+              again with twice the cooldown, up to max_cooldown.
+
+        3. acquire(), success(probe) and failure(probe):
+
+            * acquire() waits as long as the circuit does not let the request through, and returns True when the caller is the half-open probe.
+            * success() and failure() report the outcome of a request. Only the probe can close an open circuit, so a page requested before
+              the block window does not end it early.
+            * release(probe) reopens the circuit when a probe ended without reporting, e.g. on a connection error, so the waiting requests are never stuck.
+
+        4. Reporting:
+
+            * Every change of state is logged. The breaker_opens and breaker_probes counters and the breaker_wait_seconds histogram are recorded in the metrics.
+
+    """
+
+    def __init__(self, threshold=5, cooldown=60.0, max_cooldown=600.0, reports=None, metrics=None):
+        self.threshold = max(1, threshold)
+        self.base_cooldown = cooldown
+        self.max_cooldown = max(cooldown, max_cooldown)
+        self.reports = reports
+        self.metrics = metrics
+
+        self.state = CLOSED
+        self.failures = 0
+        self.cooldown = cooldown
+        self.reopen_at = 0.0
+        self.condition = None
+
+    @property
+    def is_open(self):
+        return self.state != CLOSED
+
+    def log(self, status, message):
+        if self.reports is not None:
+            self.reports.logs_report(status, data=message)
+
+    def trip(self, cooldown):
+        self.state = OPEN
+        self.cooldown = min(self.max_cooldown, cooldown)
+        self.reopen_at = time.monotonic() + self.cooldown
+
+        if self.metrics is not None:
+            self.metrics.count("breaker_opens")
+
+    async def acquire(self):
+        if self.state == CLOSED:
+            return False
+
+        if self.condition is None:
+            self.condition = asyncio.Condition()
+
+        requested = time.monotonic()
+        try:
+            async with self.condition:
+                while True:
+                    if self.state == CLOSED:
+                        return False
+
+                    if self.state == OPEN:
+                        remaining = self.reopen_at - time.monotonic()
+                        if remaining <= 0:
+                            self.state = HALF_OPEN
+                            self.log("info", "Circuit breaker half-open, sending one probe request")
+                            if self.metrics is not None:
+                                self.metrics.count("breaker_probes")
+                            return True
+                    else:
+                        # A probe is in flight
+                        remaining = None
+
+                    try:
+                        await asyncio.wait_for(self.condition.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe("breaker_wait_seconds", time.monotonic() - requested)
+
+    async def success(self, probe=False):
+        if self.state == CLOSED:
+            self.failures = 0
+            return
+
+        if not probe:
+            return
+
+        if self.condition is None:
+            self.condition = asyncio.Condition()
+
+        async with self.condition:
+            self.state = CLOSED
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+            self.log("info", "Circuit breaker closed, resuming requests")
+            self.condition.notify_all()
+
+    async def failure(self, probe=False):
+        """
+        This function counts a block signal and returns True when the circuit is open, in which case only the probe may run the browser fallback.
+        """
+
+        self.failures += 1
+
+        if self.state == CLOSED and self.failures >= self.threshold:
+            self.trip(self.base_cooldown)
+            self.log("warning", f"Circuit breaker opened after {self.failures} consecutive blocks, pausing requests for {self.cooldown:g}s")
+        elif self.state == HALF_OPEN and probe:
+            self.trip(self.cooldown * 2)
+            self.log("warning", f"Probe request was blocked, pausing requests for {self.cooldown:g}s")
+        else:
+            return self.is_open
+
+        if self.condition is not None:
+            async with self.condition:
+                self.condition.notify_all()
+
+        return True
+
+    async def release(self, probe):
+        if probe and self.state == HALF_OPEN:
+            await self.failure(probe=True)
@@ -1,11 +1,83 @@
-import undetected_chromedriver as uc
+import os
+import re
+import shutil
+import asyncio
+import subprocess
 
 from ..utils.user_agents import random_agent
+from ..utils.cache import read_cache, write_cache
+from ..utils.exceptions import GodorkException, GodorkTimeout
 
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver import ChromeService
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
-CHROME_DRIVER_PATH = ChromeDriverManager().install() 
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+DRIVER_CACHE = "chromedriver.json"
+VERSION_PATTERN = re.compile(r'([0-9]+)\.[0-9.]+')
+
+# selenium, undetected_chromedriver, webdriver_manager and psutil are imported on first use,
+# so runs that never need the browser fallback do not pay for loading them.
+
+def binary_version(binary):
+    """
+    This function runs `<binary> --version` and returns the version number it reports, or None if the binary is missing or does not answer.
+    """
+
+    try:
+        output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+def chrome_version():
+    """
+    This function returns the version of the first Chrome/Chromium binary found on the PATH, or None if none is installed.
+    """
+
+    for binary in CHROME_BINARIES:
+        if shutil.which(binary):
+            version = binary_version(binary)
+            if version is not None:
+                return version
+    return None
+
+@lru_cache(maxsize=None)
+def chrome_driver_path(driver_path=None):
+    """
+    This function resolves the chromedriver binary on first browser use and remembers it for the rest of the process.
+    The lookup order is: an explicit path (--driver-path), the GODORK_CHROMEDRIVER environment variable, the on-disk cache keyed by the Chrome version,
+    a chromedriver on the PATH whose major version matches Chrome, and finally a download through ChromeDriverManager, which is then cached.
+    """
+
+    driver_path = driver_path or os.getenv("GODORK_CHROMEDRIVER")
+    if driver_path:
+        if not os.path.isfile(driver_path):
+            raise GodorkException(f"chromedriver not found at {driver_path}")
+        return driver_path
+
+    version = chrome_version() or "unknown"
+
+    cached = read_cache(DRIVER_CACHE) or {}
+    if cached.get(version) and os.path.isfile(cached[version]):
+        return cached[version]
+
+    system_driver = shutil.which("chromedriver")
+    if system_driver:
+        driver_version = binary_version(system_driver)
+        if version == "unknown" or (driver_version and driver_version.split(".")[0] == version.split(".")[0]):
+            write_cache(DRIVER_CACHE, {**cached, version: system_driver})
+            return system_driver
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+    except Exception as err:
+        raise GodorkException(f"Unable to resolve chromedriver for Chrome {version}. Set --driver-path or GODORK_CHROMEDRIVER ({err})")
+
+    write_cache(DRIVER_CACHE, {**cached, version: path})
+    return path
 
 class SeleniumDriver:
 
@@ -18,11 +90,12 @@ class SeleniumDriver:
         1. Initialization (__init__):
 
             * The class accepts a headless_mode argument that determines whether the browser will run in headless mode (without a visible UI).
+            * An optional driver_path points to a specific chromedriver binary. Otherwise chrome_driver_path() resolves it (env var, disk cache, PATH, download).
             * Initializes a driver attribute set to None at the start.
 
         2. Context Manager (__enter__):
 
-            * When entering the context (via a with statement), the class configures the Chrome browser by setting up ChromeService with an automatically downloaded driver using ChromeDriverManager.
+            * When entering the context (via a with statement), the class calls launch(), which configures the Chrome browser by setting up ChromeService with a driver resolved on first use by chrome_driver_path().
             * Configures the Chrome options for the WebDriver:
 
                 - Disables automation flags to avoid detection (--disable-blink-features=AutomationControlled).
@@ -34,17 +107,28 @@ class SeleniumDriver:
 
         3. Exit (__exit__):
 
-            * The __exit__ method is a placeholder that ensures proper cleanup and exit behavior when leaving the context. 
-              Currently, it does nothing but could be expanded for proper resource management (e.g. closing the driver).
+            * The __exit__ method quits the driver when leaving the context.
+
+        4. Launch (launch):
+
+            * Creates and returns a new, configured WebDriver instance without managing its lifetime. Used by the BrowserPool to start warm instances.
               
     """
 
-    def __init__(self, headless_mode:bool):
+    def __init__(self, headless_mode:bool, driver_path=None):
         self.headless = headless_mode
+        self.driver_path = driver_path
         self.driver = None
 
     def __enter__(self):
-        chrome_service = ChromeService(CHROME_DRIVER_PATH)
+        self.driver = self.launch()
+        return self.driver
+
+    def launch(self):
+        import undetected_chromedriver as uc
+        from selenium.webdriver import ChromeService
+
+        chrome_service = ChromeService(chrome_driver_path(self.driver_path))
 
         options = uc.ChromeOptions()
         options.add_argument("--disable-blink-features=AutomationControlled")
@@ -57,10 +141,156 @@ class SeleniumDriver:
         if self.headless:
             options.add_argument("--headless=new")
 
-        self.driver = uc.Chrome(service=chrome_service, options=options)
-        self.driver.set_page_load_timeout(10)
-        return self.driver
+        driver = uc.Chrome(service=chrome_service, options=options)
+        driver.set_page_load_timeout(10)
+        return driver
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.driver:
             self.driver.quit()
+
+class BrowserPool:
+
+    """
+    The BrowserPool class keeps a small number of warm Chrome instances for the browser fallback, so that a blocked request does not pay
+    the startup time and memory of a new browser every time it needs one.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts the headless_mode flag, an optional chromedriver driver_path, the maximum number of browsers alive at once (size), the number of checkouts after which a browser is recycled (max_uses)
+              and the resident memory in MB above which a browser is recycled (max_memory).
+            * No browser is started until the first checkout.
+
+        2. Checkout (checkout):
+
+            * An async context manager that yields a healthy driver and returns it to the pool when the block ends.
+            * Idle browsers are reused first. A new one is launched only while fewer than `size` browsers exist, otherwise the caller waits until one is returned.
+            * A failed bypass (GodorkException or GodorkTimeout) leaves the browser usable, since the next use loads a new page, so the driver is returned
+              and the health check of the next checkout decides whether it is kept. On any other error (WebDriver or session errors, cancellation or Ctrl+C)
+              the driver is discarded instead of being returned.
+
+        3. Health Checks and Recycling:
+
+            * Before an idle browser is handed out, it must still answer a simple WebDriver call. Dead browsers are discarded and replaced.
+            * When a browser is returned, it is quit and replaced later if it reached max_uses or its process tree uses more than max_memory MB.
+
+        4. Close (close):
+
+            * Quits every idle browser. Called once at the end of the run.
+
+    Every blocking WebDriver call (launch, health check, memory check and quit) runs in the default executor so the event loop is never blocked.
+
+    """
+
+    def __init__(self, headless_mode:bool, size:int=1, max_uses:int=20, max_memory:int=1024, driver_path=None):
+        self.headless = headless_mode
+        self.driver_path = driver_path
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.max_memory = max_memory
+
+        self.idle = []
+        self.uses = {}
+        self.created = 0
+        self.condition = None
+
+    @asynccontextmanager
+    async def checkout(self):
+        driver = await self.acquire()
+        try:
+            yield driver
+        except (GodorkException, GodorkTimeout):
+            await self.release(driver)
+            raise
+        except BaseException:
+            await self.discard(driver)
+            raise
+        else:
+            await self.release(driver)
+
+    async def acquire(self):
+        if self.condition is None:
+            self.condition = asyncio.Condition()
+
+        async with self.condition:
+            while True:
+                while self.idle:
+                    driver = self.idle.pop()
+                    if await self.run_blocking(self.is_healthy, driver):
+                        return driver
+                    await self.discard(driver, notify=False)
+
+                if self.created < self.size:
+                    self.created += 1
+                    break
+
+                await self.condition.wait()
+
+        try:
+            driver = await self.run_blocking(SeleniumDriver(headless_mode=self.headless, driver_path=self.driver_path).launch)
+        except BaseException:
+            async with self.condition:
+                self.created -= 1
+                self.condition.notify()
+            raise
+
+        self.uses[id(driver)] = 0
+        return driver
+
+    async def release(self, driver):
+        self.uses[id(driver)] = self.uses.get(id(driver), 0) + 1
+
+        if self.uses[id(driver)] >= self.max_uses or await self.run_blocking(self.memory_usage, driver) > self.max_memory:
+            await self.discard(driver)
+            return
+
+        async with self.condition:
+            self.idle.append(driver)
+            self.condition.notify()
+
+    async def discard(self, driver, notify=True):
+        self.uses.pop(id(driver), None)
+        await self.run_blocking(self.quit, driver)
+
+        if notify:
+            async with self.condition:
+                self.created -= 1
+                self.condition.notify()
+        else:
+            self.created -= 1
+
+    async def close(self):
+        while self.idle:
+            await self.discard(self.idle.pop(), notify=False)
+
+    async def run_blocking(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    @staticmethod
+    def is_healthy(driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def memory_usage(driver):
+        import psutil
+
+        try:
+            process = psutil.Process(driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(proc.memory_info().rss for proc in processes) / 1024 ** 2
+        except Exception:
+            return 0
+
+    @staticmethod
+    def quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,58 @@
+import asyncio
+
+from ..helpers.extractor import parse_page, parse_bytes
+
+class ParsePool:
+
+    """
+    The ParsePool class is the parsing stage of the scraper. It keeps CPU-bound page parsing off the event loop, so that with several requests in flight
+    the loop only does I/O and parsing no longer throttles how many responses it can service.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts the number of parser processes (--parse-workers) and the smallest body, in bytes, that is worth sending to a process.
+            * With 0 workers every page is parsed inline. The process pool is only started on the first page that needs it.
+
+        2. parse(data, encoding):
+
+            * Raw response bytes of at least min_size are sent to a ProcessPoolExecutor, decoded and parsed there by parse_bytes, and only the compact
+              result record (page title, last page and title/link pairs) comes back.
+            * Small bodies (e.g. empty or blocked pages), where pickling would cost more than parsing, and text that is already decoded
+              (cached pages and browser page sources) are parsed inline.
+
+        3. close():
+
+            * Shuts the process pool down at the end of the run.
+
+    """
+
+    def __init__(self, workers=0, min_size=16 * 1024):
+        self.workers = workers
+        self.min_size = min_size
+        self.executor = None
+
+    def get_executor(self):
+        if self.executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn keeps the parser processes independent of the threads already running in the scraper
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self.executor
+
+    async def parse(self, data, encoding="utf-8"):
+        if isinstance(data, str):
+            return parse_page(data)
+
+        if self.workers <= 0 or len(data) < self.min_size:
+            return parse_bytes(data, encoding)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.get_executor(), parse_bytes, data, encoding)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
@@ -0,0 +1,202 @@
+import time
+import asyncio
+
+from urllib.parse import urlparse
+
+from ..helpers.metrics import FAST_BUCKETS
+
+def is_congested(status):
+    """
+    This function tells whether a response status means the provider wants us to slow down: a redirect (to the /sorry page), 429 or a 5xx.
+    """
+
+    return 300 <= status <= 399 or status == 429 or status >= 500
+
+class HostLimit:
+
+    """
+    The HostLimit class is the token bucket and in-flight limit of one host. Its rate and concurrency are adjusted by AIMD
+    (additive increase, multiplicative decrease), the way TCP adjusts its congestion window.
+    """
+
+    def __init__(self, host, rate, min_rate, max_rate, concurrency, increase, decrease):
+        self.host = host
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max(rate, max_rate)
+        self.concurrency = float(concurrency)
+        self.max_concurrency = float(concurrency)
+        self.increase = increase
+        self.decrease = decrease
+
+        # A bucket of one token spaces the requests evenly instead of letting a burst through after an idle period
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.in_flight = 0
+        self.last_decrease = 0.0
+        self.peak_rate = rate
+        self.decreases = 0
+        self.condition = None
+
+    def refill(self, now):
+        self.tokens = min(1.0, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        if self.condition is None:
+            self.condition = asyncio.Condition()
+
+        async with self.condition:
+            while True:
+                now = time.monotonic()
+                self.refill(now)
+
+                slots = self.in_flight < int(self.concurrency)
+                if slots and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.in_flight += 1
+                    return now
+
+                # Wait for the next token, or for a request to finish when every slot is taken
+                try:
+                    await asyncio.wait_for(self.condition.wait(), (1 - self.tokens) / self.rate if slots else None)
+                except asyncio.TimeoutError:
+                    pass
+
+    def feedback(self, started, status):
+        """
+        This function applies the response status of a request sent at `started` and returns True when the limits were lowered.
+        """
+
+        if status is None:
+            return False
+
+        if is_congested(status):
+            return self.lower(started)
+
+        if status == 200:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+            self.peak_rate = max(self.peak_rate, self.rate)
+
+        return False
+
+    def lower(self, started):
+        # Requests sent before the last decrease saw the old limits, so one block window only lowers them once
+        if started < self.last_decrease:
+            return False
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self.concurrency = max(1.0, self.concurrency * self.decrease)
+        self.last_decrease = time.monotonic()
+        self.decreases += 1
+        return True
+
+    async def release(self, started, status):
+        self.in_flight -= 1
+        lowered = self.feedback(started, status)
+
+        async with self.condition:
+            self.condition.notify_all()
+
+        return lowered
+
+class RateLimiter:
+
+    """
+    The RateLimiter class paces the requests sent by Requester.aioreqwest, so the scraper runs as fast as the provider tolerates
+    instead of hitting the /sorry page and spending minutes in the browser fallback.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts the starting rate in requests per second (--rate), the highest and lowest rate, the highest number of requests in flight
+              (--concurrency), the additive step and the multiplicative factor. Reports and Metrics are optional.
+            * Every host gets its own HostLimit, created on its first request.
+
+        2. acquire(url) and release(limit, started, status):
+
+            * acquire waits until the host has a token and a free slot, and returns its HostLimit and the time the request was let through.
+            * release gives the slot back and adapts the limits to the status of the response:
+
+                - 200: the rate grows by the step (0.1 req/s by default) and the concurrency by one slot per window of requests.
+                - 3xx, 429 or 5xx: the rate and the concurrency are multiplied by the factor (halved by default). Requests that were already
+                  in flight when the limits were lowered do not lower them again.
+                - Anything else, or a connection error, leaves the limits as they are.
+
+            * penalize(url, started) lowers the limits for a block that arrives with a 200, such as the javascript "Google Search" page.
+
+        3. Reporting:
+
+            * Every decrease is logged with the new rate and concurrency and the peak rate reached before it, which is the rate the provider tolerated.
+            * The current rate and concurrency of every host are kept as the rate_limit_rps and rate_limit_concurrency gauges, and the time spent waiting
+              for a slot as the rate_limit_wait_seconds histogram.
+            * describe() returns one line per host for the end of the run.
+
+    """
+
+    def __init__(self, rate=2.0, max_rate=20.0, min_rate=0.1, concurrency=1, increase=0.1, decrease=0.5, reports=None, metrics=None):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, rate)
+        self.concurrency = max(1, int(concurrency))
+        self.increase = increase
+        self.decrease = decrease
+        self.reports = reports
+        self.metrics = metrics
+        self.hosts = {}
+
+    def host(self, url):
+        host = urlparse(str(url)).hostname or ""
+        limit = self.hosts.get(host)
+        if limit is None:
+            limit = self.hosts[host] = HostLimit(host, self.rate, self.min_rate, self.max_rate, self.concurrency, self.increase, self.decrease)
+        return limit
+
+    async def acquire(self, url):
+        limit = self.host(url)
+        requested = time.monotonic()
+        started = await limit.acquire()
+
+        if self.metrics is not None:
+            self.metrics.observe("rate_limit_wait_seconds", started - requested, buckets=FAST_BUCKETS + (0.5, 1.0, 2.5, 5.0, 10.0), host=limit.host)
+
+        return limit, started
+
+    async def release(self, limit, started, status):
+        whole_rate = int(limit.rate)
+        lowered = await limit.release(started, status)
+        self.report(limit, lowered, whole_rate, status)
+
+    def penalize(self, url, started):
+        """
+        This function lowers the limits of the host of url for a block that the status could not show, such as the javascript
+        "Google Search" page that comes back as a 200. started is the time the blocked request was sent.
+        """
+
+        limit = self.host(url)
+        self.report(limit, limit.lower(started), int(limit.rate))
+
+    def report(self, limit, lowered, whole_rate, status=None):
+        if self.metrics is not None:
+            self.metrics.set("rate_limit_rps", round(limit.rate, 3), host=limit.host)
+            self.metrics.set("rate_limit_concurrency", int(limit.concurrency), host=limit.host)
+
+        if self.reports is None:
+            return
+
+        if lowered:
+            reason = f"HTTP {status}" if status is not None else "a blocked page"
+            self.reports.logs_report("warning", data=f"Rate limit for {limit.host} lowered to {limit.rate:.2f} req/s and {int(limit.concurrency)} in flight after {reason} (peak {limit.peak_rate:.2f} req/s)")
+        elif int(limit.rate) > whole_rate:
+            self.reports.logs_report("debug", "Rate limit for %s raised to %.2f req/s and %d in flight", limit.host, limit.rate, int(limit.concurrency))
+
+    def describe(self):
+        """
+        This function returns the summary line of every host that was requested during the run.
+        """
+
+        return [
+            f"Rate limit for {limit.host}: {limit.rate:.2f} req/s, {int(limit.concurrency)} in flight (peak {limit.peak_rate:.2f} req/s, {limit.decreases} decreases)"
+            for limit in self.hosts.values()
+        ]
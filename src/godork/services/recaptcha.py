@@ -1,14 +1,15 @@
 import os
 import time
 import pydub
-import urllib
+import uuid
 import asyncio
+import urllib.request
 import speech_recognition
 
 from tempfile import gettempdir
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from ..helpers.console import Console
 from ..helpers.reports import Reports
 from ..utils.colors import Bgcolor
 from ..utils.exceptions import GodorkException, GodorkTimeout
@@ -32,11 +33,12 @@ class RecaptchaBypass:
 
             * The class is initialized with debug and headless_mode flags, allowing control over the debugging output and 
               whether the browser runs in headless mode (without a visible UI).
-            * It also initializes instances of Console and Reports to handle logging and reporting during execution.
+            * It reuses the Reports instance of the caller (or creates one) so that its events go through the same log file and console handler.
+            * It owns a dedicated thread pool (one thread per pooled browser) where all blocking browser and audio work runs.
 
         2. reCAPTCHA Handling (recaptcha_service):
 
-            * This asynchronous method automates the process of solving a reCAPTCHA by interacting with the CAPTCHA iframe, clicking the checkbox, and navigating through the audio challenge.
+            * This blocking method automates the process of solving a reCAPTCHA by interacting with the CAPTCHA iframe, clicking the checkbox, and navigating through the audio challenge.
             * The method performs several actions in sequence:
 
                 - Switching to the reCAPTCHA iframe.
@@ -75,25 +77,29 @@ class RecaptchaBypass:
 
         8. Solve CAPTCHA (solve_captcha):
 
-            * This asynchronous method accepts a URL, launches a Selenium WebDriver, and 
-              attempts to solve the CAPTCHA on the page using the previously mentioned methods.
+            * This asynchronous method accepts a WebDriver and a URL and attempts to solve the CAPTCHA on the page using the previously mentioned methods.
+            * The whole sequence (page load, element waits, sleeps, audio download, conversion and transcription) runs in the dedicated thread pool,
+              so HTTP fetching for other dorks continues on the event loop while a browser task is in progress.
+            * It returns the final URL and page source of the browser, read in the same worker thread.
             * The process is wrapped in a try-except block to handle errors gracefully, with reports and console logs to provide real-time feedback.
 
+        9. Close (close):
+
+            * Shuts the thread pool down at the end of the run.
+
     """
 
-    def __init__(self, debug:bool, headless_mode:bool):
-        self.console = Console()
-        self.reports = Reports()
+    def __init__(self, debug:bool, headless_mode:bool, reports=None, workers:int=1):
+        self.reports = reports if reports is not None else Reports(debug=debug)
 
         self.debug = debug
         self.headless = headless_mode
 
-        self.wait = None
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="godork-browser")
     
-    async def recaptcha_service(self, driver):
+    def recaptcha_service(self, driver, wait):
         # Switching to iframe containing reCAPTCHA
         self.reports.logs_report("debug", data="Switching to iframe containing reCAPTCHA")
-        self.console.debugging(self.debug, msg="Switching to iframe containing reCAPTCHA")
 
         try:
             iframe_inner = driver.find_element(By.XPATH, "//iframe[@title='reCAPTCHA']")
@@ -105,10 +111,9 @@ class RecaptchaBypass:
 
         # Click on the recaptcha
         self.reports.logs_report("debug", data="Clicking the reCAPTCHA checkbox")
-        self.console.debugging(self.debug, msg="Clicking the reCAPTCHA checkbox")
 
         try:
-            self.wait.until(
+            wait.until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, ".rc-anchor-content"))
             ).click()
         except TimeoutException:
@@ -121,7 +126,6 @@ class RecaptchaBypass:
 
         # Locating audio challenge iframe
         self.reports.logs_report("debug", data="Locating audio challenge iframe")
-        self.console.debugging(self.debug, msg="Locating audio challenge iframe")
 
         try:
             iframe = driver.find_element(By.XPATH, "//iframe[contains(@title, 'recaptcha')]")
@@ -131,10 +135,9 @@ class RecaptchaBypass:
 
         # Click on the audio button
         self.reports.logs_report("debug", data="Clicking the audio button")
-        self.console.debugging(self.debug, msg="Clicking the audio button")
 
         try:
-            self.wait.until(
+            wait.until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "#recaptcha-audio-button"))
             ).click()
         except TimeoutException:
@@ -144,30 +147,27 @@ class RecaptchaBypass:
 
         # Wait for the audio source to load
         self.reports.logs_report("debug", data="Waiting for the audio source to load completely")
-        self.console.debugging(self.debug, msg="Waiting for the audio source to load completely")
 
         try:
-            audio_source = self.wait.until(
+            audio_source = wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "#audio-source"))
             )
             src = audio_source.get_attribute("src")
-            self.reports.logs_report("debug", data=f"Getting the audio URL {src}")
-            self.console.debugging(self.debug, msg=f"Getting the audio URL {src}")
+            self.reports.logs_report("debug", "Getting the audio URL %s", src)
         except TimeoutException:
             raise GodorkTimeout("Failed to load audio source")
 
         # Download, convert, and decode audio reCAPTCHA
         try:
-            key = await self.handle_audio_captcha(src)
+            key = self.handle_audio_captcha(src)
         except (speech_recognition.exceptions.UnknownValueError, speech_recognition.exceptions.RequestError):
             raise GodorkException("Failed to recognize")
 
         # Input the key
         self.reports.logs_report("debug", data="Entering the transcribed phrase")
-        self.console.debugging(self.debug, msg="Entering the transcribed phrase")
 
         try:
-            self.wait.until(
+            wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "#audio-response"))
             ).send_keys(key.lower())
         except TimeoutException:
@@ -175,10 +175,9 @@ class RecaptchaBypass:
 
         # Submit the key
         self.reports.logs_report("debug", data="Submitting the phrase")
-        self.console.debugging(self.debug, msg="Submitting the phrase")
 
         try:
-            self.wait.until(
+            wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "#audio-response"))
             ).send_keys(Keys.RETURN)
         except TimeoutException:
@@ -186,16 +185,15 @@ class RecaptchaBypass:
 
         # Waiting briefly for reCAPTCHA to process the input
         self.reports.logs_report("debug", data="Waiting briefly for reCAPTCHA to process the input")
-        self.console.debugging(self.debug, msg="Waiting briefly for reCAPTCHA to process the input")
 
         time.sleep(3)
 
         if self.is_blocked(driver):
             return
 
-        self.console.log_print("info", msg="Successfully bypassed v2 protection")
+        self.reports.logs_report("info", data="Successfully bypassed v2 protection")
     
-    async def handle_audio_captcha(self, src_url):
+    def handle_audio_captcha(self, src_url):
         """Main handler to download, convert and decode audio CAPTCHA"""
         mp3_path, wav_path = self.get_temp_audio_paths()
 
@@ -203,35 +201,27 @@ class RecaptchaBypass:
         self.convert_mp3_to_wav(mp3_path, wav_path)
 
         try:
-            phrase = await self.async_decode_audio(wav_path)
+            phrase = self.decode_audio(wav_path)
         finally:
             # Delete temporary files
             self.reports.logs_report("debug", data="Deleting temporary audio files")
-            self.console.debugging(self.debug, msg="Deleting temporary audio files")
             self.cleanup_temp_files(mp3_path, wav_path)
 
         return phrase
     
     def download_audio(self, src, save_path):
         self.reports.logs_report("debug", data="Downloading the audio to the temp folder")
-        self.console.debugging(self.debug, msg="Downloading the audio to the temp folder")
         
         urllib.request.urlretrieve(src, save_path)
 
     def convert_mp3_to_wav(self, mp3_path, wav_path):
         self.reports.logs_report("debug", data="Converting MP3 to WAV format")
-        self.console.debugging(self.debug, msg="Converting MP3 to WAV format")
 
         sound = pydub.AudioSegment.from_mp3(mp3_path)
         sound.export(wav_path, format="wav")
 
-    async def async_decode_audio(self, wav_path):
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.decode_audio, wav_path)
-    
     def decode_audio(self, wav_path):
         self.reports.logs_report("debug", data="Transcribing the audio content")
-        self.console.debugging(self.debug, msg="Transcribing the audio content")
 
         recognizer = speech_recognition.Recognizer()
         with speech_recognition.AudioFile(wav_path) as source:
@@ -244,10 +234,10 @@ class RecaptchaBypass:
                 os.remove(path)
             except Exception as e:
                 self.reports.logs_report("warning", data=f"Failed to delete {path}: {e}")
-                self.console.log_print("warning", f"Failed to delete {path}: {e}")
 
     def get_temp_audio_paths(self):
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        # A unique suffix keeps concurrent bypasses in the browser threads from sharing files
+        timestamp = f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{uuid.uuid4().hex[:8]}"
         mp3 = os.path.join(gettempdir(), f"{timestamp}.mp3")
         wav = os.path.join(gettempdir(), f"{timestamp}.wav")
 
@@ -264,17 +254,23 @@ class RecaptchaBypass:
         blocked = self.get_text_blocked(driver)
         if blocked is not None:
             self.reports.logs_report("error", data=f"Failed to bypass v2 protection. IP has been blocked! {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:{blocked.text}")
-            self.console.log_print("error", msg=f"Failed to bypass v2 protection. IP has been blocked! {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:{blocked.text}")
 
         if driver.current_url == "https://www.google.com/sorry/index":
             self.reports.logs_report("error", data="Unexpected response comes from search engines")
-            self.console.log_print("error", msg="Unexpected response comes from search engines")
     
-    async def solve_captcha(self, driver, url):
-        self.reports.logs_report("debug", data=f"Bad URL {url}")
-        self.console.debugging(self.debug, msg=f"Bad URL {url}")
+    def bypass(self, driver, url):
+        self.reports.logs_report("debug", "Bad URL %s", url)
 
-        self.wait = WebDriverWait(driver, 5)
+        wait = WebDriverWait(driver, 5)
 
         driver.get(url)
-        await self.recaptcha_service(driver)
\ No newline at end of file
+        self.recaptcha_service(driver, wait)
+
+        return driver.current_url, driver.page_source
+
+    async def solve_captcha(self, driver, url):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.bypass, driver, url)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
@@ -1,5 +1,11 @@
+import time
+
 from ..utils.user_agents import random_agent
 
+CHUNK_SIZE = 64 * 1024
+# Redirect bodies up to this size are drained so that the connection can be reused; larger ones close it
+REDIRECT_DRAIN_SIZE = 8 * 1024
+
 class Requester:
 
     """
@@ -33,12 +39,22 @@ class Requester:
             * Upon receiving the response, it updates response_dict with the body content of the response, allowing asynchronous access to the data. 
               The function then returns the response object, providing an efficient way to handle multiple requests concurrently.
             * This method is ideal for situations requiring non-blocking I/O operations, such as when dealing with large-scale web scraping or API calls.
+            * The body is read in chunks into one buffer. With max_size (bytes) the read stops once the limit is reached, the body is cut there
+              and the connection is closed instead of downloading the rest.
+            * When redirects are not followed, the body of a 3xx response is never buffered or decoded and an empty body is returned.
+              Up to 8 KB of it is drained so the connection can be reused, and a longer or endless chunked body closes the connection instead.
+            * With raw=True the buffer (a bytearray) is returned as is, so the parser can scan it without a decode or another copy. Otherwise it is decoded to text.
+            * When a RateLimiter is given, every request first waits for a token and a free slot of its host, and the response status
+              is passed back so the limiter can adapt its rate and concurrency.
+            * When a Metrics registry is given, every request records its latency by status class, the number of bytes received and any connection error.
     
     The class leverages both requests for traditional synchronous requests and aiohttp for asynchronous tasks, offering flexibility depending on the needs of the application.
 
     """
 
-    def __init__(self):
+    def __init__(self, metrics=None, limiter=None):
+        self.metrics = metrics
+        self.limiter = limiter
         self.headers = {
             "User-Agent": str(random_agent),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -60,15 +76,64 @@ class Requester:
         return response
 
     async def aioreqwest(self, session, method, url, **kwargs):
-        async with session.request(
-            method=method,
-            url=url,
-            proxy=kwargs.get("proxy"),
-            params=kwargs.get("params"),
-            timeout=kwargs.get("timeout"),
-            cookies=kwargs.get("cookies"),
-            headers=self.headers if not kwargs.get("headers") else kwargs.get("headers"),
-            allow_redirects=kwargs.get("redirects")
-        ) as response:
-            body = await response.text()
-            return response, body
\ No newline at end of file
+        limit = None
+        status = None
+        if self.limiter is not None:
+            limit, started = await self.limiter.acquire(url)
+
+        start = time.perf_counter()
+        try:
+            async with session.request(
+                method=method,
+                url=url,
+                proxy=kwargs.get("proxy"),
+                params=kwargs.get("params"),
+                timeout=kwargs.get("timeout"),
+                cookies=kwargs.get("cookies"),
+                headers=self.headers if not kwargs.get("headers") else kwargs.get("headers"),
+                allow_redirects=kwargs.get("redirects")
+            ) as response:
+                status = response.status
+                raw = await self.read_body(response, kwargs.get("max_size"), skip=not kwargs.get("redirects") and 300 <= response.status <= 399)
+                body = raw if kwargs.get("raw") else raw.decode(response.charset or "utf-8", errors="replace")
+        except Exception as err:
+            if self.metrics is not None:
+                self.metrics.count("request_errors", error=type(err).__name__)
+            raise
+        finally:
+            if limit is not None:
+                await self.limiter.release(limit, started, status)
+
+        if self.metrics is not None:
+            status_class = f"{status // 100}xx"
+            self.metrics.observe("request_seconds", time.perf_counter() - start, status=status_class)
+            self.metrics.count("requests", status=status_class)
+            self.metrics.count("bytes_received", len(raw))
+
+        return response, body
+
+    async def read_body(self, response, max_size=None, skip=False):
+        buffer = bytearray()
+
+        if skip:
+            if response.content_length is None or response.content_length <= REDIRECT_DRAIN_SIZE:
+                # A body of unknown length (chunked) is drained up to the same size, and leaving the rest unread closes the connection
+                drained = 0
+                while drained <= REDIRECT_DRAIN_SIZE:
+                    chunk = await response.content.readany()
+                    if not chunk:
+                        break
+                    drained += len(chunk)
+            return buffer
+
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            buffer += chunk
+
+            if max_size and len(buffer) >= max_size:
+                del buffer[max_size:]
+                if self.metrics is not None:
+                    self.metrics.count("bodies_truncated")
+                # Leaving the rest unread makes aiohttp close the connection instead of downloading it
+                break
+
+        return buffer
\ No newline at end of file
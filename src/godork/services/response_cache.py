@@ -0,0 +1,130 @@
+import os
+import time
+import json
+import sqlite3
+import asyncio
+import hashlib
+import threading
+
+from ..utils.cache import cache_dir
+
+class ResponseCache:
+
+    """
+    The ResponseCache class is an optional, persistent cache of search result pages stored in a single SQLite file.
+    It lets a re-run of the same dork list (after a crash or a parser change) serve pages fetched recently without another round trip to the search engine.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts a time-to-live in seconds (ttl), a size limit in bytes (max_size) and an optional database path. By default the database lives in ~/.cache/godork/responses.sqlite.
+            * Counts hits, misses and evictions for the run summary.
+
+        2. Keys (make_key):
+
+            * A cache key is the SHA-1 of the normalized (q, start) pair: whitespace in the query is collapsed and start is converted to an integer,
+              so the same page always maps to the same entry whatever other parameters (client, channel) were sent.
+
+        3. Lookup and Store (get, put, aget, aput):
+
+            * get returns the cached body while it is younger than ttl and refreshes its access time. Expired entries are deleted on access.
+            * put stores a body (the raw UTF-8 bytes of the response, or text) and then evicts the least recently used entries until the total size fits in max_size.
+            * aget and aput run the same operations in the default executor so the event loop never waits on SQLite.
+
+        4. Close (close):
+
+            * Closes the database connection at the end of the run.
+
+    """
+
+    def __init__(self, ttl=24 * 60 * 60, max_size=512 * 1024 ** 2, path=None):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.path = path or os.path.join(cache_dir(), "responses.sqlite")
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self.total_size = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(query, start):
+        normalized = json.dumps([" ".join(str(query).split()), int(start)], ensure_ascii=False)
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, query, start):
+        key = self.make_key(query, start)
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute("SELECT body, size, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            body, size, created_at = row
+            if now - created_at >= self.ttl:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.total_size -= size
+                self.misses += 1
+                return None
+
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return body
+
+    def put(self, query, start, body):
+        key = self.make_key(query, start)
+        size = len(body.encode("utf-8")) if isinstance(body, str) else len(body)
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.total_size -= row[0]
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, body, size, now, now)
+            )
+            self.total_size += size
+
+            while self.total_size > self.max_size:
+                oldest = self.conn.execute("SELECT key, size FROM responses ORDER BY accessed_at LIMIT 1").fetchone()
+                if oldest is None:
+                    break
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (oldest[0],))
+                self.total_size -= oldest[1]
+                self.evictions += 1
+
+    async def aget(self, query, start):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, query, start)
+
+    async def aput(self, query, start, body):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.put, query, start, body)
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.total_size,
+        }
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,59 @@
+import random
+
+class Backoff:
+
+    """
+    The Backoff class computes exponential backoff delays with full jitter for retried requests.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts the base delay in seconds and the cap that no delay may exceed.
+
+        2. delay(attempt)
+
+            * Returns a random delay between 0 and min(cap, base * 2 ** (attempt - 1)) seconds.
+              The random spread keeps many concurrent dorks that were blocked at the same time from retrying in lockstep.
+
+    """
+
+    def __init__(self, base:float=0.5, cap:float=30.0):
+        self.base = base
+        self.cap = cap
+
+    def delay(self, attempt:int):
+        if self.base <= 0:
+            return 0
+        return random.uniform(0, min(self.cap, self.base * 2 ** max(0, attempt - 1)))
+
+class RetryBudget:
+
+    """
+    The RetryBudget class is a simple counter that limits how many retries a unit of work (one page or one dork) may spend.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * Accepts the number of retries allowed. A limit of 0 or lower means no retry is allowed.
+
+        2. spend()
+
+            * Consumes one retry and returns True, or returns False once the budget is exhausted.
+
+    """
+
+    def __init__(self, limit:int):
+        self.limit = limit
+        self.used = 0
+
+    def spend(self):
+        if self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
+
+    @property
+    def remaining(self):
+        return max(0, self.limit - self.used)
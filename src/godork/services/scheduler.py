@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import concurrent.futures
+
+# Marks the end of the dorks read by the reader thread
+END = object()
+
+class DorkScheduler:
+
+    """
+    The DorkScheduler class is a small, bounded job scheduler that runs several dorks at the same time on a single event loop.
+    It is used by the Scraper to spread the dork list over a fixed number of workers that all share the same ClientSession.
+
+    Key Features:
+
+        1. Initialization (__init__):
+
+            * The class accepts a concurrency argument that determines how many dorks may be enumerated at once.
+            * Values lower than 1 are clamped to 1, which gives the same sequential behaviour as a plain for loop.
+            * With blocking=True the dork iterator may block (stdin or the queue of a --workers process), so it is read by a daemon thread
+              that feeds a small bounded queue. A slow or interactive pipe then never stalls the requests, heartbeats and metrics of the event loop.
+
+        2. Running Jobs (run):
+
+            * Starts `concurrency` workers that pull dorks from one shared iterator, so every dork is handed out exactly once and in input order.
+            * Each worker awaits the job for its current dork before taking the next one. Pages of a single dork therefore stay strictly ordered,
+              while pages of different dorks interleave fairly every time a worker waits on the network.
+            * Because the dorks are pulled lazily from the iterator, the scheduler never needs the whole list in memory.
+
+        3. Error Handling:
+
+            * If a job raises, the remaining workers are cancelled and the exception is propagated to the caller so that the run stops cleanly.
+
+    """
+
+    def __init__(self, concurrency:int, blocking:bool=False):
+        self.concurrency = max(1, int(concurrency))
+        self.blocking = blocking
+
+    def read(self, iterator, queue, loop):
+        """
+        This function runs in the reader thread. It moves the dorks into the queue, waiting while the queue is full, and ends it with one END per worker.
+        An exception raised by the iterator is put in the queue and raised again by the worker that receives it.
+        """
+
+        def put(item):
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        try:
+            try:
+                for query in iterator:
+                    put(query)
+            except Exception as err:
+                put(err)
+            for _ in range(self.concurrency):
+                put(END)
+        except (RuntimeError, concurrent.futures.CancelledError):
+            # The run ended (or the event loop was closed) before every dork was read
+            pass
+
+    async def run(self, dorks, job):
+        iterator = iter(dorks)
+
+        if self.blocking:
+            queue = asyncio.Queue(maxsize=self.concurrency)
+            threading.Thread(target=self.read, args=(iterator, queue, asyncio.get_running_loop()), name="godork-dork-reader", daemon=True).start()
+
+            async def worker():
+                while True:
+                    query = await queue.get()
+                    if query is END:
+                        return
+                    if isinstance(query, Exception):
+                        raise query
+                    await job(query)
+        else:
+            async def worker():
+                for query in iterator:
+                    await job(query)
+
+        tasks = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -1,20 +1,35 @@
-import re
 import os
 import time
+import asyncio
 import random
-import psutil
+
+from datetime import datetime
 
 from aiohttp import ClientSession, TCPConnector
 
 from ..utils.colors import Bgcolor
 from ..utils.exceptions import GodorkException, GodorkTimeout, GodorkNoData, GodorkMaxRetries
-from ..utils.parse import get_query, get_page_num, set_page_num
+from ..utils.parse import get_query, get_page_num, set_page_num, iter_dorks, shard_of
 from ..helpers.console import Console
-from ..helpers.reports import Reports
-from ..helpers.extractor import extract_pages, extract_data
+from ..helpers.reports import Reports, reports_dir
+from ..helpers.checkpoint import Checkpoint, resolve_run, PAGE_OK, PAGE_SKIPPED, DORK_DONE, DORK_FAILED
+from ..helpers.extractor import extract_data, UTF8_ENCODINGS
+from ..helpers.dedup import make_seen_set, restore_seen
+from ..helpers.metrics import Metrics, FAST_BUCKETS
+from ..helpers.profiler import Profiler
+from ..helpers.output import ResultWriter
 from .requester import Requester
-from .driver import SeleniumDriver
-from .recaptcha import RecaptchaBypass
+from .scheduler import DorkScheduler
+from .driver import BrowserPool
+from .response_cache import ResponseCache
+from .parsing import ParsePool
+from .ratelimit import RateLimiter
+from .breaker import CircuitBreaker
+from .retry import Backoff, RetryBudget
+
+# Request lifecycle states used by fetch_urls
+FETCH = "fetch"
+FALLBACK = "fallback"
 
 class Scraper:
 
@@ -28,17 +43,42 @@ class Scraper:
 
             * The class initializes a number of key parameters like:
 
-                - Dorks: A list of search queries (either from a file or input string).
-                - Debugging and Proxy Settings: Configuration for debugging and using proxies.
-                - Retries: Mechanism to retry failed requests with a configurable retry count and maximum retry limit.
+                - Dorks: A stream of search queries read lazily from a file, from stdin (--dorks -) or from the input string. Blank and # comment lines are skipped.
+                - Resume: The run id of an interrupted run (or "last"). Its report files are reused, and the dork source recorded in its journal is used when no dorks are given.
+                - Shard: An (index, count) pair. Only dorks whose stable hash falls in this shard are run (--shard i/n and --workers).
+                - Output: The format of the results written to stdout (--output text, ndjson, tsv or plain).
+                - Sink: Set by the --workers runner. Reports, log lines and metrics are forwarded to the parent process instead of being written here,
+                  and the introduction and final messages are left to the parent.
+                - Debugging and Proxy Settings: Configuration for debugging, the log file format and using proxies.
+                - Retries: Mechanism to retry failed requests with a per-page retry count, a per-dork retry budget, a maximum number of bypass attempts and exponential backoff with jitter.
+                - Concurrency: The number of dorks that are enumerated at the same time.
+                - Circuit Breaker: The number of consecutive blocks after which every request pauses for a cooldown (--breaker-threshold and --breaker-cooldown). 0 disables it.
+                - Rate: The starting and highest number of requests per second of the adaptive rate limiter (--rate and --max-rate). 0 disables it.
                 - Headless Mode: Configuration to run the scraper in headless mode for browser interactions.
+                - Browser Pool: The number of warm browsers kept for the fallback and when they are recycled (after N uses or above a memory limit).
 
             * The scraper utilizes several components for functionality:
 
                 - Console: For logging and output management.
-                - Reports: For generating detailed reports about the scraping process.
+                - ResultWriter: Writes the new results of every page to stdout in the --output format through a block-buffered writer.
+                - Reports: For generating detailed reports about the scraping process. Its logger writes every event to the log file and the console in one call.
                 - Requester: For handling the HTTP requests (both synchronous and asynchronous).
-                - RecaptchaBypass: A service for bypassing CAPTCHA protections encountered during scraping.
+                - CircuitBreaker: With --breaker-threshold, a breaker shared by every dork that pauses all requests for a cooldown after consecutive blocks
+                  and lets a single probe request through before resuming.
+                - RateLimiter: With --rate, a per-host token bucket in front of every request. Its rate and the number of requests in flight grow
+                  while pages come back with 200 and are halved on redirects to the /sorry page, 429 and 5xx responses.
+                - DorkScheduler: For running several dorks at once over the shared ClientSession.
+                - BrowserPool: A pool of reusable browser instances used by the CAPTCHA fallback.
+                - Checkpoint: A durable journal of every processed (dork, page) and how each dork ended, used by --resume.
+                - ResponseCache: An optional on-disk cache of result pages keyed by (q, start), enabled with --cache.
+                - Metrics: A registry of request latency by status class, bytes received, parse time, results, retries, fallbacks and browser time.
+                  A JSON summary (and, with --metrics-file, a Prometheus text file) is rewritten every --metrics-interval seconds while the run is in progress.
+                - ParsePool: The parsing stage. With --parse-workers N (and more than one dork at a time) the raw bytes of result pages are parsed
+                  in N processes and only the compact results come back, so the event loop only does I/O.
+                - Profiler: With --profile the run is wrapped in cProfile and the fetch, parse, write and fallback stages of every page are timed.
+                  The pstats file, the span log and (with --profile-memory) a tracemalloc diff are saved under reports/profile.
+                - RecaptchaBypass: A service for bypassing CAPTCHA protections encountered during scraping. It is created on the first fallback,
+                  so the selenium and audio dependencies are only imported when a bypass is actually needed.
 
         2. Parameter Construction (params):
 
@@ -50,53 +90,142 @@ class Scraper:
 
         3. Asynchronous Connection Handling (reuse_connection):
 
-            * This function manages retries when CAPTCHA protection is triggered on Google search results pages.
-            * It calls the RecaptchaBypass.solve_captcha method to handle CAPTCHA challenges.
-            * If CAPTCHA is detected, the method tries to bypass it by interacting with the page's reCAPTCHA service and retries the process for a set number of attempts.
+            * This function makes a single attempt to bypass the CAPTCHA protection triggered on Google search results pages and returns the final URL and page source of the browser.
+            * It checks a warm browser out of the BrowserPool and calls the RecaptchaBypass.solve_captcha method to handle CAPTCHA challenges.
+            * The browser goes back to the pool as soon as the page has been read, before any retry or follow-up request.
+            * All blocking browser work runs in the RecaptchaBypass thread pool, so other dorks keep fetching while a bypass is in progress.
 
         4. Fetching URLs (fetch_urls):
 
-            * This method initiates an HTTP GET request to retrieve search result pages.
-            * It handles various HTTP response codes:
-
-                - 200 OK: Processes valid search results and extracts data.
-                - 3xx Redirects: Detects CAPTCHA challenges and attempts to bypass them.
-                - 4xx and 5xx Errors: Logs client and server errors.
-
-            * It attempts to bypass reCAPTCHA challenges automatically when detected.
-            * If the request fails, it retries a set number of times before throwing an error.
-
-        5. Fetching Links (fetch_links):
-
-            * This method handles the core logic of iterating through search queries (dorks) and fetching search result pages.
-            * For each query, it sends requests to multiple pages (using the params method to adjust the page number) and attempts to extract links and titles from the result.
+            * Returns the parsed page (title, last known page and results) so that the caller can decide whether to keep paginating, or None when no results were collected.
+            * When the response cache is enabled and holds a fresh copy of the page, the cached body is used and no request is sent.
+            * Otherwise the request lifecycle is an iterative state machine (no recursion):
+
+                - FETCH: Sends an HTTP GET request. 200 OK processes the results (and stores the page in the response cache when enabled),
+                  a 3xx redirect to the sorry page moves to FALLBACK, and 4xx/5xx errors are logged.
+                  The body is read as raw bytes (at most --max-body-size KB, none for redirects) and parsed without decoding the whole page.
+                - An "unexpected provider response" is retried after an exponential backoff with jitter, spending both the per-page budget (--retries) and the per-dork budget (--dork-retries).
+                - FALLBACK: Calls reuse_connection. A browser page with results is processed directly; otherwise the browser URL is re-fetched over HTTP (back to FETCH).
+                  Failed bypasses are retried with backoff up to --max-retries times, and every retry after the first spends the per-dork budget.
+                - With the circuit breaker, every FETCH first waits while the circuit is open, and block signals and result pages are reported to it.
+                  A page blocked while the circuit is open spends the per-page budget and waits for the circuit instead of moving to FALLBACK,
+                  so during a block window only the half-open probe runs the browser.
+
+            * GodorkMaxRetries is raised once any of these budgets is exhausted.
+
+        5. Fetching Links (fetch_links and fetch_dork):
+
+            * fetch_links hands the search queries (dorks) to the DorkScheduler, which runs up to `concurrency` of them at once.
+            * fetch_dork handles a single query. It sends requests to multiple pages in order (using the params method to adjust the page number) and attempts to extract links and titles from the result.
+            * Pages of one dork are always fetched sequentially, so the per-dork ordering of the reports is preserved.
+            * New links are checked against a run-wide seen-set (--dedup exact or bloom) so that links already reported by another page or dork are not printed or written again.
+              The per-dork counts of new and duplicate links are logged and written to the report as a summary record when the dork is finished.
+            * Pagination stops as soon as the current page is the last one listed in the pager ("Total known pages"), or when a page only returns links already seen for that dork.
             * It also gracefully handles exceptions such as timeouts and CAPTCHA protection issues, retrying requests when necessary.
+            * Every processed page and the end of every dork are written to the checkpoint journal. On --resume, finished dorks are skipped,
+              partial dorks continue from the next page and the links of the existing report are loaded into the seen-set, so nothing is reported twice.
 
         6. Running the Scraper (run_with_async):
 
             * This method serves as the entry point for running the asynchronous scraper.
             * It starts by printing introductory messages, including warnings about using the scraper responsibly.
             * Using async with ClientSession, it establishes a session to interact with Google search, managing retries and exceptions along the way.
-            * Once the scraping process completes, the session is closed, and the final report is saved.
+            * Once the scraping process completes, the session is closed, the final metrics are published and summarized, and the final report is saved.
 
     """
 
-    def __init__(self, dorks, proxy, debug, retries, max_retries, headless_mode):
+    def __init__(
+        self, dorks, proxy, debug, retries, max_retries, headless_mode,
+        concurrency=1, log_format="text",
+        browsers=1, browser_max_uses=20, browser_max_memory=1024, driver_path=None,
+        cache=False, cache_ttl=86400, cache_size=512,
+        dork_retries=100, backoff=0.5, dedup="exact",
+        metrics_interval=10.0, metrics_file=None, profile=False, profile_memory=False,
+        resume=None, shard=None, run_id=None, sink=None,
+        parse_workers=0, max_body_size=2048, output="text",
+        rate=0, max_rate=20.0,
+        breaker_threshold=0, breaker_cooldown=60.0,
+    ):
         self.base_url = "https://www.google.com/search"
     
-        self.dorks = dorks.strip().splitlines() if not os.path.isfile(dorks) else open(dorks, 'r').read().strip().splitlines()
+        if run_id is None and resume:
+            run_id = resolve_run(f"{reports_dir()}/journal", resume)
         self.proxy = proxy
         self.debug = debug
         self.retries = retries
         self.max_retries = max_retries
+        self.dork_retries = dork_retries
+        self.backoff = Backoff(base=backoff)
         self.headless = headless_mode
+        self.concurrency = concurrency
+        self.seen = make_seen_set(dedup)
+        self.metrics_interval = metrics_interval
+        self.metrics_file = metrics_file
+        self.sink = sink
+        self.max_body_size = max_body_size * 1024 if max_body_size else None
 
         self.console = Console()
-        self.reports = Reports()
-        self.requester = Requester()
-        self.recaptcha_service = RecaptchaBypass(debug, headless_mode=headless_mode)
+        self.metrics = Metrics()
+        self.reports = Reports(debug=debug, log_format=log_format, metrics=self.metrics, run_id=run_id, sink=sink)
+        self.checkpoint = Checkpoint(self.reports.journal_file, commit=self.journal)
+        self.rate_limiter = RateLimiter(rate, max_rate=max_rate, concurrency=concurrency, reports=self.reports, metrics=self.metrics) if rate > 0 else None
+        self.requester = Requester(metrics=self.metrics, limiter=self.rate_limiter)
+        self.breaker = CircuitBreaker(breaker_threshold, cooldown=breaker_cooldown, reports=self.reports, metrics=self.metrics) if breaker_threshold > 0 else None
+        # Worker processes forward their results with the report records and the parent writes them
+        self.output = ResultWriter(output) if sink is None else None
+        # A single dork at a time leaves nothing to overlap with parsing, so it is parsed inline
+        self.parse_pool = ParsePool(parse_workers if concurrency > 1 else 0)
+        self.profiler = Profiler(profile, output_dir=f"{self.reports.base_dir}/profile", run_id=self.reports.run_id if shard is None else f"{self.reports.run_id}.{shard[0]}", memory=profile_memory)
+        self.browser_pool = BrowserPool(headless_mode, size=browsers, max_uses=browser_max_uses, max_memory=browser_max_memory, driver_path=driver_path)
+        self.recaptcha_service = None
+        self.response_cache = ResponseCache(ttl=cache_ttl, max_size=cache_size * 1024 ** 2) if cache else None
+
+        if resume:
+            self.checkpoint.load()
+            dorks = dorks or self.checkpoint.recorded_dorks()
+            if not dorks:
+                raise GodorkException(f"Run {run_id} read its dorks from stdin, pass them again with --dorks -")
+            self.restore_seen()
+
+        if isinstance(dorks, str):
+            self.dorks_source = os.path.abspath(dorks) if os.path.isfile(dorks) else (None if dorks == "-" else dorks)
+            self.dorks = iter_dorks(dorks)
+        else:
+            # Dorks routed by the --workers runner
+            self.dorks_source = None
+            self.dorks = iter(dorks)
+
+        if shard is not None:
+            index, count = shard
+            self.dorks = (query for query in self.dorks if shard_of(query, count) == index)
+
+        # stdin and the queue of a --workers process can block, so they are read off the event loop
+        self.scheduler = DorkScheduler(concurrency, blocking=dorks == "-" or not isinstance(dorks, str))
+
+    def journal(self, record):
+        """
+        This function writes a record of the checkpoint journal once the report records before it are on disk, so a killed run never
+        marks a page as done while its results are still buffered. Worker processes forward it to the parent, which writes it the same way.
+        """
+
+        if self.sink is not None:
+            self.sink("journal", record)
+        else:
+            self.reports.after(self.checkpoint.write, record)
+
+    def restore_seen(self):
+        """
+        This function loads the links of an existing report into the seen-set, so a resumed run does not report them again.
+        """
+
+        if self.seen is None or not os.path.isfile(self.reports.json_file):
+            return
+
+        restore_seen(self.seen, self.reports.json_file)
 
     def get_memory_usage(self):
+        import psutil
+
         process = psutil.Process(os.getpid())
         print(self.console.text_format("info", msg=f"Memory usage: {process.memory_info().rss / 1024 ** 2:.2f} MB"))
 
@@ -108,147 +237,349 @@ class Scraper:
             "start": page,
         }
     
-    async def reuse_connection(self, session, url, retry_count=0, **kwargs):
-        num_page = kwargs.get("num_page")
+    async def parse(self, html, query=None, num_page=None, encoding="utf-8"):
+        with self.profiler.span("parse", query, num_page), self.metrics.timer("parse_seconds", buckets=FAST_BUCKETS):
+            return await self.parse_pool.parse(html, encoding)
+
+    def extract(self, html, query, num_page, page):
+        with self.profiler.span("write", query, set_page_num(num_page)):
+            page = extract_data(html, reports=self.reports, metadata={"query": query, "num_page": set_page_num(num_page)}, page=page, seen=self.seen, output=self.output)
+
+        self.metrics.count("pages")
+        self.metrics.count("results", len(page["results"]))
+        self.metrics.count("new_links", page["new"])
+        self.metrics.count("duplicate_links", page["duplicates"])
 
-        if retry_count >= self.max_retries:
-            raise GodorkMaxRetries("Maximum retries attempts reached for solving v2 protection")
+        return page
 
+    async def reuse_connection(self, url):
         self.reports.logs_report("info", data="Initiating v2 bypass...")
-        self.console.log_print("info", msg="Initiating v2 bypass...")
 
-        with SeleniumDriver(headless_mode=self.headless) as driver:
-            try:
-                await self.recaptcha_service.solve_captcha(driver, url)
-
-                target_url = driver.current_url
-                data_html = driver.page_source
-
-                try:
-                    last_page = extract_pages(data_html)
-                    self.reports.logs_report("info", data=f"Total known pages: {last_page}")
-                    self.console.log_print("info", msg=f"Total known pages: {last_page}")
-                except IndexError:
-                    pass
-                
-                extract_data(data_html, reports=self.reports, metadata={"query": get_query(url), "num_page": set_page_num(num_page)})
-
-                await self.fetch_urls(session, url=target_url, params=None)
-            
-            except (GodorkException, GodorkTimeout) as err:
-                self.reports.logs_report("error", data=f"Failed to bypass v2 protection. {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:{err}")
-                self.console.log_print("error", msg=f"Failed to bypass v2 protection. {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:{err}")
-
-                self.reports.logs_report("info", data=f"Retrying bypass of v2 protection (attempt: {retry_count+1}) on page {set_page_num(num_page)}")
-                self.console.log_print("info", msg=f"Retrying bypass of v2 protection (attempt: {retry_count+1}) on page {set_page_num(num_page)}")
-
-                await self.reuse_connection(session, url, num_page=num_page, retry_count=retry_count + 1)
-            finally:
-                driver.quit()
+        if self.recaptcha_service is None:
+            # The browser and audio stack is only loaded once a fallback is actually needed
+            from .recaptcha import RecaptchaBypass
+            self.recaptcha_service = RecaptchaBypass(self.debug, headless_mode=self.headless, reports=self.reports, workers=self.browser_pool.size)
 
-    async def fetch_urls(self, session, url, **kwargs):
-        num_page = kwargs.get("params")["start"] if kwargs.get("params") is not None else get_page_num(url)
-        i = 0
+        with self.metrics.timer("browser_seconds"):
+            async with self.browser_pool.checkout() as driver:
+                return await self.recaptcha_service.solve_captcha(driver, url)
 
-        while True:
-            i += 1
-            response, data_html = await self.requester.aioreqwest(
-                session,
-                method="GET",
-                url=url,
-                proxy=self.proxy,
-                params=kwargs.get("params"),
-                timeout=10,
-                redirects=False
-            )
-            
-            self.reports.logs_report("debug", data=f"Initiating request to {str(response.url)}")
-            self.console.debugging(self.debug, msg=f"Initiating request to {str(response.url)}")
-
-            self.reports.logs_report("debug", data=f"Getting response status {response.status}")
-            self.console.debugging(self.debug, msg=f"Getting response status {response.status}")
-
-            if "Google Search" not in re.findall("<title>(.*?)</title>", data_html):
-
-                if response.status == 200:
-                    try:
-                        last_page = extract_pages(data_html)
-                        self.reports.logs_report("info", data=f"Total known pages: {last_page}")
-                        self.console.log_print("info", msg=f"Total known pages: {last_page}")
-                    except IndexError:
-                        pass
+    async def fetch_urls(self, session, url, budget=None, **kwargs):
+        params = kwargs.get("params")
+        num_page = params["start"] if params is not None else get_page_num(url)
+        query = params["q"] if params is not None else get_query(url)
 
-                    extract_data(data_html, reports=self.reports, metadata={"query": get_query(response.url), "num_page": set_page_num(num_page)})
+        page_budget = RetryBudget(self.retries)
+        dork_budget = budget if budget is not None else RetryBudget(self.dork_retries)
 
-                if 300 <= response.status <= 399 and "https://www.google.com/sorry/index" in response.headers.get("Location"):
-                    url_redirection = response.headers["Location"]
+        state = FETCH
+        target_url = url
+        attempts = 0
+        fallbacks = 0
 
-                    self.reports.logs_report("debug", data=f"Getting the redirect URL {url_redirection}")
-                    self.console.debugging(self.debug, msg=f"Getting the redirect URL {url_redirection}")
+        if self.response_cache is not None:
+            data_html = await self.response_cache.aget(query, num_page)
 
-                    self.reports.logs_report("warning", data="Requests were blocked due to provider-side protection")
-                    self.console.log_print("warning", msg="Requests were blocked due to provider-side protection    ")
-                    
-                    self.reports.logs_report("warning", data=f"reCAPTCHA detected on the page {set_page_num(num_page)}")
-                    self.console.debugging(self.debug, msg=f"reCAPTCHA detected on the page {set_page_num(num_page)}")
+            if data_html is not None:
+                self.reports.logs_report("debug", "Serving page %s from the response cache", set_page_num(num_page))
+                self.metrics.count("cache_hits")
+                return self.extract(data_html, query, num_page, await self.parse(data_html, query, set_page_num(num_page)))
 
-                    await self.reuse_connection(session, url=url_redirection, num_page=num_page, retry_count=0)
+        probe = False
+        try:
+            while True:
+                if state == FETCH:
+                    if self.breaker is not None and not probe:
+                        probe = await self.breaker.acquire()
 
-                if 400 <= response.status <= 499:
-                    self.reports.logs_report("error", data=f"Failed to fetch request on page {set_page_num(num_page)} {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:Client error occurred")
-                    self.console.log_print("error", msg=f"Failed to fetch request on page {set_page_num(num_page)} {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:Client error occurred")
+                    sent = time.monotonic()
+                    with self.profiler.span("fetch", query, set_page_num(num_page)):
+                        response, data_html = await self.requester.aioreqwest(
+                            session,
+                            method="GET",
+                            url=target_url,
+                            proxy=self.proxy,
+                            params=params,
+                            timeout=10,
+                            redirects=False,
+                            raw=True,
+                            max_size=self.max_body_size
+                        )
 
-                if 500 <= response.status <= 599:
-                    self.reports.logs_report("error", data=f"Failed to fetch request on page {set_page_num(num_page)} {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:Server error occurred")
-                    self.console.log_print("error", msg=f"Failed to fetch request on page {set_page_num(num_page)} {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:Server error occurred")
+                    self.reports.logs_report("debug", "Initiating request to %s", response.url)
 
-                break
+                    self.reports.logs_report("debug", "Getting response status %s", response.status)
+
+                    encoding = response.charset or "utf-8"
+                    page = await self.parse(data_html, query, set_page_num(num_page), encoding)
+
+                    if page["title"] == "Google Search":
+                        attempts += 1
+                        self.metrics.count("retries", reason="blocked")
+
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.penalize(response.url, sent)
+
+                        if self.breaker is not None:
+                            await self.breaker.failure(probe)
+                            probe = False
+
+                        if not page_budget.spend():
+                            raise GodorkMaxRetries("The request failed after reaching the maximum number of retries attempts")
+                        if not dork_budget.spend():
+                            raise GodorkMaxRetries(f"The retry budget for {query} has been exhausted")
+
+                        print(f"\r{self.console.out_log_format('warning', msg=f'Unexpected provider response. Retrying (request: {attempts})')}", flush=True, end="\r")
 
-            if i >= self.retries:
-                raise GodorkMaxRetries("The request failed after reaching the maximum number of retries attempts")
+                        await asyncio.sleep(self.backoff.delay(attempts))
+                        continue
 
-            else:
-                print(f"\r{self.console.out_log_format('warning', msg=f'Unexpected provider response. Retrying (request: {i})')}", flush=True, end="\r")
+                    if response.status == 200:
+                        if self.breaker is not None:
+                            await self.breaker.success(probe)
+
+                        if self.response_cache is not None:
+                            await self.response_cache.aput(query, num_page, data_html if encoding.lower() in UTF8_ENCODINGS else data_html.decode(encoding, errors="replace"))
+
+                        if page["last_page"] is not None:
+                            self.reports.logs_report("info", data=f"Total known pages: {page['last_page']}")
+
+                        return self.extract(data_html, get_query(response.url), num_page, page)
+
+                    if 300 <= response.status <= 399 and "https://www.google.com/sorry/index" in response.headers.get("Location", ""):
+                        if self.breaker is not None and await self.breaker.failure(probe) and not probe:
+                            # The circuit is open, so wait for it to close instead of launching a browser
+                            self.metrics.count("retries", reason="breaker")
+                            if not page_budget.spend():
+                                raise GodorkMaxRetries("The request failed after reaching the maximum number of retries attempts")
+
+                            self.reports.logs_report("debug", "Page %s is waiting for the circuit breaker", set_page_num(num_page))
+                            continue
+
+                        target_url = response.headers["Location"]
+
+                        self.reports.logs_report("debug", "Getting the redirect URL %s", target_url)
+
+                        self.reports.logs_report("warning", data="Requests were blocked due to provider-side protection")
                     
-    async def fetch_links(self, session, url):
-        for query in self.dorks:
+                        self.reports.logs_report("warning", data=f"reCAPTCHA detected on the page {set_page_num(num_page)}")
+
+                        state = FALLBACK
+                        continue
+
+                    if 400 <= response.status <= 499:
+                        self.reports.logs_report("error", data=f"Failed to fetch request on page {set_page_num(num_page)} {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:Client error occurred")
+
+                    if 500 <= response.status <= 599:
+                        self.reports.logs_report("error", data=f"Failed to fetch request on page {set_page_num(num_page)} {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:Server error occurred")
+
+                    return None
+
+                if state == FALLBACK:
+                    if self.breaker is not None and not probe and self.breaker.is_open:
+                        # The circuit opened while this page was waiting for a browser, so only the probe may use one
+                        state = FETCH
+                        target_url = url
+                        params = kwargs.get("params")
+                        continue
+
+                    if fallbacks >= self.max_retries:
+                        raise GodorkMaxRetries("Maximum retries attempts reached for solving v2 protection")
+
+                    if fallbacks > 0:
+                        self.metrics.count("retries", reason="bypass")
+                        if not dork_budget.spend():
+                            raise GodorkMaxRetries(f"The retry budget for {query} has been exhausted")
+
+                        self.reports.logs_report("info", data=f"Retrying bypass of v2 protection (attempt: {fallbacks}) on page {set_page_num(num_page)}")
+                        await asyncio.sleep(self.backoff.delay(fallbacks))
+
+                    fallbacks += 1
+                    self.metrics.count("fallbacks")
+
+                    try:
+                        with self.profiler.span("fallback", query, set_page_num(num_page)):
+                            browser_url, data_html = await self.reuse_connection(target_url)
+                    except (GodorkException, GodorkTimeout) as err:
+                        self.metrics.count("bypass_failures")
+                        self.reports.logs_report("error", data=f"Failed to bypass v2 protection. {Bgcolor.BLUE}reason{Bgcolor.DEFAULT}:{err}")
+                        continue
+
+                    page = await self.parse(data_html, query, set_page_num(num_page))
+
+                    if page["results"]:
+                        if self.breaker is not None:
+                            await self.breaker.success(probe)
+
+                        if page["last_page"] is not None:
+                            self.reports.logs_report("info", data=f"Total known pages: {page['last_page']}")
+
+                        return self.extract(data_html, query, num_page, page)
+
+                    # The browser did not land on a result page, so re-fetch it over HTTP now that the block should be lifted
+                    state = FETCH
+                    target_url = browser_url
+                    params = None
+        finally:
+            if self.breaker is not None:
+                await self.breaker.release(probe)
+
+    async def fetch_dork(self, session, url, query):
+        start_page = self.checkpoint.start_page(query)
+
+        if start_page > 1:
+            self.reports.logs_report("info", data=f"{Bgcolor.BOLD}Resuming enumeration for {query} from page {start_page}{Bgcolor.DEFAULT}")
+        else:
             self.reports.logs_report("info", data=f"{Bgcolor.BOLD}Starting enumeration for {query}{Bgcolor.DEFAULT}")
-            self.console.log_print("info", msg=f"{Bgcolor.BOLD}Starting enumeration for {query}{Bgcolor.DEFAULT}")
-
-            for i in range(0, 501, 10):
-                self.console.debugging(self.debug, msg=f"Performing an HTTP GET request on page {set_page_num(i)}")
-                self.reports.logs_report("info", data=f"Performing an HTTP GET request on page {set_page_num(i)}")
-
-                try:
-                    await self.fetch_urls(session, url=url, params=self.params(query=query, page=i))
-                except GodorkMaxRetries as err:
-                    self.reports.logs_report("warning", data=err)
-                    self.console.log_print("warning", msg=err)
-        
-                    self.reports.logs_report("info", data="Try using the `--no-headless` option to make changes")
-                    self.console.log_print("info", msg="Try using the `--no-headless` option to make changes")
-                    break
-                except GodorkNoData as err:
-                    self.reports.logs_report("info", data=err)
-                    self.console.log_print("info", msg=err)
+
+        seen_links = set()
+        budget = RetryBudget(self.dork_retries)
+        summary = {"pages": 0, "new": 0, "duplicates": 0}
+        status, reason = DORK_DONE, "page_limit"
+
+        for i in range((start_page - 1) * 10, 501, 10):
+            self.reports.logs_report("debug", "Performing an HTTP GET request on page %s", set_page_num(i))
+
+            try:
+                page = await self.fetch_urls(session, url=url, budget=budget, params=self.params(query=query, page=i))
+
+                if page is None:
+                    self.checkpoint.page(query, set_page_num(i), PAGE_SKIPPED)
+                    continue
+
+                self.checkpoint.page(query, set_page_num(i), PAGE_OK)
+
+                summary["pages"] += 1
+                summary["new"] += page.get("new", 0)
+                summary["duplicates"] += page.get("duplicates", 0)
+
+                links = {result["link"] for result in page["results"]}
+                if links <= seen_links:
+                    self.reports.logs_report("info", data=f"No new links on page {set_page_num(i)} for {query}, stopping enumeration")
+                    reason = "no_new_links"
                     break
-                except Exception as err:
-                    self.reports.logs_report("error", data=err)
-                    self.console.log_print("error", msg=err)
+                seen_links |= links
+
+                # Without a pager the page count is unknown, so only the novelty check and the page limit end the dork
+                if page["last_page"] is not None and page["last_page"] <= set_page_num(i):
+                    self.reports.logs_report("info", data=f"Reached the last known page {set_page_num(i)} for {query}")
+                    reason = "last_page"
                     break
+            except GodorkMaxRetries as err:
+                self.reports.logs_report("warning", data=err)
+    
+                self.reports.logs_report("info", data="Try using the `--no-headless` option to make changes")
+                status, reason = DORK_FAILED, "max_retries"
+                break
+            except GodorkNoData as err:
+                self.metrics.count("empty_pages")
+                self.reports.logs_report("info", data=err)
+                reason = "no_data"
+                break
+            except Exception as err:
+                self.reports.logs_report("error", data=err)
+                status, reason = DORK_FAILED, "error"
+                break
+
+        self.checkpoint.finish(query, status, reason)
+
+        self.reports.logs_report("info", data=f"Finished {query}: {summary['new']} new and {summary['duplicates']} duplicate links on {summary['pages']} pages")
+        self.reports.json_report({
+            "timestamp": str(datetime.now()),
+            "query": query,
+            "summary": summary,
+        })
+
+    def pending_dorks(self):
+        for query in self.dorks:
+            if self.checkpoint.is_done(query):
+                self.reports.logs_report("debug", "Skipping %s, already finished in run %s", query, self.reports.run_id)
+                continue
+            yield query
+
+    async def fetch_links(self, session, url):
+        await self.scheduler.run(self.pending_dorks(), lambda query: self.fetch_dork(session, url, query))
+
+    async def forward_metrics(self):
+        while True:
+            await asyncio.sleep(self.metrics_interval)
+            self.metrics.update_memory()
+            self.sink("metrics", self.metrics.export())
+
+    def summarize_metrics(self):
+        if self.sink is not None:
+            self.metrics.update_memory()
+            self.sink("metrics", self.metrics.export())
+            return
+
+        self.metrics.publish(self.reports.metrics_file, self.metrics_file)
+        snapshot = self.metrics.snapshot()
+
+        self.reports.logs_report("info", data=self.metrics.describe(snapshot))
+        self.reports.json_report({
+            "timestamp": str(datetime.now()),
+            "metrics": snapshot,
+        })
+
+    def summarize_profile(self):
+        stages = self.profiler.stop()
+
+        for stage, timing in stages.items():
+            self.reports.logs_report("info", data=f"Profile: {stage} {timing['count']} spans, {timing['total']:.3f}s total, {timing['avg'] * 1000:.2f}ms avg")
+
+        if self.profiler.enabled:
+            self.reports.logs_report("info", data=f"Profile saved to {self.profiler.path('pstats')}")
 
     async def run_with_async(self):
-        print(self.console.text_format("info", msg="A high-speed scraper for collecting links and titles from Google search results"))
-        print(self.console.text_format("warning", msg="Use with caution. You are responsible for your actions"))
-        print(self.console.text_format("warning", msg="Developers assume no liability and are not responsible for any issue or damage"))
+        if self.sink is None:
+            print(self.console.text_format("info", msg="A high-speed scraper for collecting links and titles from Google search results"))
+            print(self.console.text_format("warning", msg="Use with caution. You are responsible for your actions"))
+            print(self.console.text_format("warning", msg="Developers assume no liability and are not responsible for any issue or damage"))
+
+            await asyncio.sleep(1)
+
+        self.metrics.restart()
+        self.profiler.start()
+        self.checkpoint.open(self.dorks_source, header=self.sink is None)
 
-        time.sleep(1)
+        reporter = None
+        if self.metrics_interval > 0 and self.sink is not None:
+            reporter = asyncio.ensure_future(self.forward_metrics())
+        elif self.metrics_interval > 0:
+            reporter = asyncio.ensure_future(self.metrics.report_every(self.metrics_interval, self.reports.metrics_file, self.metrics_file))
 
         async with ClientSession(connector=TCPConnector(ssl=False if self.proxy else True)) as session:
             try:
                 await self.fetch_links(session, url=self.base_url)
             finally:
+                if reporter is not None:
+                    reporter.cancel()
+
                 await session.close()
+                await self.browser_pool.close()
+                self.parse_pool.close()
+
+                if self.recaptcha_service is not None:
+                    self.recaptcha_service.close()
+
+                if self.rate_limiter is not None:
+                    for line in self.rate_limiter.describe():
+                        self.reports.logs_report("info", data=line)
+
+                if self.response_cache is not None:
+                    stats = self.response_cache.stats()
+                    self.reports.logs_report("info", data=f"Response cache: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
+                    self.response_cache.close()
+
+                self.summarize_metrics()
+                self.summarize_profile()
+                # The writer thread still has journal records to write, so the journal is closed after the report
+                self.reports.close()
+                self.checkpoint.close()
+
+                if self.output is not None:
+                    self.output.close()
 
-        print(self.console.text_format("info", msg="Report saved to {}".format(self.reports.base_dir)))
-        self.get_memory_usage()
\ No newline at end of file
+        if self.sink is None:
+            print(self.console.text_format("info", msg="Report saved to {}".format(self.reports.base_dir)))
+            self.get_memory_usage()
\ No newline at end of file
@@ -1,9 +1,12 @@
+import os
 import json
-import requests
+import time
+import threading
 
 from .requester import Requester
 from ..utils.banner import print_banner
 from ..utils.colors import Bgcolor
+from ..utils.cache import read_cache, write_cache
 
 """
 The release_version() function is a simple yet effective mechanism for retrieving the latest release version of a tool from GitHub. 
@@ -15,7 +18,7 @@ Key Elements:
     1. CURRENT_VERSION:
 
         * This constant represents the current, locally installed version of the software tool.
-        * This version is used as a fallback in the event that the latest release cannot be fetched from the GitHub repository.
+        * This version is compared with the cached latest release to decide whether the banner shows "latest" or "outdated".
 
     2. release_version() Function:
 
@@ -33,12 +36,19 @@ Key Elements:
         * Error Handling:
 
             - If the request fails for any reason (e.g., network issues, API issues), 
-              the function catches the exception and returns the current local version (CURRENT_VERSION) along with None for the release notes.
+              the function catches the exception and returns None for both values, so that a failed lookup is not cached as a release.
+
+    3. check_version() Function:
+
+        * Prints the banner without waiting on the network. The status comes from the on-disk cache (~/.cache/godork/version.json).
+        * When the cached entry is older than VERSION_CACHE_TTL, release_version() runs in a background daemon thread and refreshes the cache for the next run,
+          so scraping starts immediately and many short-lived workers share one lookup per day.
+        * The check is skipped entirely with --no-update-check or by setting the GODORK_NO_UPDATE_CHECK environment variable.
 
 Key Points:
 
         * GitHub API Integration: The function leverages GitHub's API to fetch the latest release information for the "godork" tool, ensuring that users can easily stay up to date with the latest version.
-        * Fallback Mechanism: If there are any issues fetching the release version, the current local version is returned to avoid errors in the application.
+        * Fallback Mechanism: If there are any issues fetching the release version, None is returned, nothing is cached and the banner shows "unknown" until a lookup succeeds.
         * Error Handling: The use of a try-except block ensures that even if the request to the GitHub API fails, the program will continue running without crashing, and the user will receive information about the current version of the software.
 
 Usage Scenario:
@@ -50,20 +60,48 @@ Usage Scenario:
 
 CURRENT_VERSION = "v2.6.2"
 
-def check_version():
+VERSION_CACHE = "version.json"
+VERSION_CACHE_TTL = 24 * 60 * 60
+
+def parse_version(version):
+    try:
+        return tuple(int(part) for part in version.lstrip("v").split("."))
+    except (AttributeError, ValueError):
+        return ()
+
+def update_check_disabled():
+    return os.getenv("GODORK_NO_UPDATE_CHECK", "").lower() not in ("", "0", "false", "no")
+
+def refresh_version_cache():
     release_vers, _ = release_version()
-    if release_vers is not None and CURRENT_VERSION < release_vers:
-        print_banner(status=f"{Bgcolor.RED}outdated{Bgcolor.DEFAULT}", version=CURRENT_VERSION)
-    if release_vers is not None and CURRENT_VERSION == release_vers:
-        print_banner(status=f"{Bgcolor.GREEN}latest{Bgcolor.DEFAULT}", version=CURRENT_VERSION)
+    if release_vers is not None:
+        write_cache(VERSION_CACHE, {"tag_name": release_vers, "checked_at": time.time()})
+
+def check_version(enabled=True):
+    if not enabled or update_check_disabled():
+        print_banner(status=f"{Bgcolor.GRAY}unchecked{Bgcolor.DEFAULT}", version=CURRENT_VERSION)
+        return
+
+    cached = read_cache(VERSION_CACHE) or {}
+    release_vers = cached.get("tag_name")
+
+    if time.time() - cached.get("checked_at", 0) >= VERSION_CACHE_TTL:
+        threading.Thread(target=refresh_version_cache, name="godork-version-check", daemon=True).start()
+
     if release_vers is None:
+        print_banner(status=f"{Bgcolor.GRAY}unknown{Bgcolor.DEFAULT}", version=CURRENT_VERSION)
+    elif parse_version(CURRENT_VERSION) < parse_version(release_vers):
         print_banner(status=f"{Bgcolor.RED}outdated{Bgcolor.DEFAULT}", version=CURRENT_VERSION)
+    else:
+        print_banner(status=f"{Bgcolor.GREEN}latest{Bgcolor.DEFAULT}", version=CURRENT_VERSION)
 
 def release_version():
+    import requests
+
     session = requests.session()
     try:
         response = Requester().reqwest(session, "GET", url="https://api.github.com/repos/thd3r/godork/releases/latest", timeout=10)
         data_json = json.loads(response.text)
         return data_json["tag_name"], data_json["body"]
     except:
-        return CURRENT_VERSION, None
\ No newline at end of file
+        return None, None
\ No newline at end of file
@@ -0,0 +1,262 @@
+import os
+import time
+import queue
+import asyncio
+import threading
+import multiprocessing
+
+from datetime import datetime
+
+from ..helpers.console import Console
+from ..helpers.reports import Reports, reports_dir
+from ..helpers.metrics import Metrics
+from ..helpers.output import ResultWriter, setup_output
+from ..helpers.dedup import make_seen_set, restore_seen
+from ..helpers.checkpoint import Checkpoint, resolve_run
+from ..utils.parse import iter_dorks, shard_of
+from ..utils.exceptions import GodorkException
+
+# Messages sent from the workers to the parent: (kind, worker, payload)
+RECORD = "record"
+LOG = "log"
+METRICS = "metrics"
+JOURNAL = "journal"
+DONE = "done"
+
+def run_worker(index, shard, options, inbox, outbox):
+    """
+    This function is the entry point of a worker process. It runs a Scraper on its shard of the dorks and forwards every report record,
+    log line and metrics update to the parent through outbox.
+    """
+
+    from .scrape import Scraper
+
+    setup_output(options.get("output", "text"))
+
+    def sink(kind, payload):
+        outbox.put((kind, index, payload))
+
+    options = dict(options, shard=shard, sink=sink)
+    if inbox is not None:
+        options["dorks"] = iter(inbox.get, None)
+
+    scraper = None
+    try:
+        scraper = Scraper(**options)
+        asyncio.run(scraper.run_with_async())
+    except KeyboardInterrupt:
+        pass
+    except Exception as err:
+        sink(LOG, f"[{datetime.now().strftime('%Y/%m/%d %H:%M:%S')}] [EROR] Worker {index} failed: {err}\n")
+    finally:
+        outbox.put((DONE, index, scraper.metrics.export() if scraper is not None else None))
+
+class ShardedRunner:
+
+    """
+    The ShardedRunner class implements --workers. It splits the dork stream across worker processes, each running its own Scraper and event loop,
+    so parsing and report work use every core of the host, and merges their output into one run.
+
+    Key Features:
+
+        1. Sharding:
+
+            * Every dork is assigned by a stable hash (shard_of) to one of workers x n shards, where n comes from --shard i/n (1 without it).
+              Worker k of machine i runs shard i + k * n, so the same dork always lands on the same machine and worker.
+            * Dork files and inline dorks are read by every worker, which keeps only its own shard. Dorks read from stdin are read once by the parent
+              and routed to the workers through bounded queues, so memory stays constant.
+
+        2. Merging:
+
+            * Workers forward their report records and log lines to the parent, which writes them to the one NDJSON report and log file of the run.
+              The parent also writes the results of every record to stdout, so the lines of different workers never interleave.
+            * The parent keeps the seen-set of the run. Links already reported by another worker are dropped from a record before it is written,
+              and the counts of the record, the summary of its dork and the metrics are corrected, so --dedup holds across workers.
+            * Workers send their metrics every --metrics-interval seconds. The parent merges the latest state of every worker and publishes the
+              JSON summary (and the Prometheus file) as a single run.
+            * Workers forward their journal records too, and the parent writes each one after the report records before it,
+              so --resume works with --workers as well.
+
+        3. Shutdown:
+
+            * On Ctrl+C the workers stop their own runs and the parent keeps collecting their output until every worker is done.
+
+    """
+
+    def __init__(self, options, workers, shard=None, resume=None):
+        self.options = dict(options)
+        self.workers = workers
+        self.shard = shard or (0, 1)
+        self.resume = resume
+        self.console = Console()
+
+        run_id = resolve_run(f"{reports_dir()}/journal", resume) if resume else None
+
+        self.metrics = Metrics()
+        self.reports = Reports(debug=self.options.get("debug", False), log_format=self.options.get("log_format", "text"), run_id=run_id)
+        self.checkpoint = Checkpoint(self.reports.journal_file)
+        self.output = ResultWriter(self.options.get("output", "text"))
+        self.seen = make_seen_set(self.options.get("dedup", "exact"))
+        self.dropped = {}
+        self.states = {}
+
+        dorks = self.options.get("dorks")
+        if resume:
+            dorks = dorks or self.checkpoint.load().recorded_dorks()
+            if not dorks:
+                raise GodorkException(f"Run {self.reports.run_id} read its dorks from stdin, pass them again with --dorks -")
+            if self.seen is not None and os.path.isfile(self.reports.json_file):
+                restore_seen(self.seen, self.reports.json_file)
+
+        self.dorks = dorks
+        self.options.update(dorks=dorks, run_id=self.reports.run_id, resume=resume)
+
+    def worker_shard(self, index):
+        machine, machines = self.shard
+        return (machine + index * machines, machines * self.workers)
+
+    def route_stdin(self, inboxes):
+        machine, machines = self.shard
+        try:
+            for query in iter_dorks("-"):
+                slot = shard_of(query, machines * self.workers)
+                if slot % machines == machine:
+                    inboxes[slot // machines].put(query)
+        finally:
+            for inbox in inboxes:
+                inbox.put(None)
+
+    def merged_metrics(self):
+        metrics = Metrics()
+        metrics.started = self.metrics.started
+        for state in self.states.values():
+            if state is not None:
+                metrics.merge(state)
+        # Links that only the parent found to be duplicates
+        metrics.merge(self.metrics.export())
+        return metrics
+
+    def deduplicate(self, payload):
+        """
+        This function drops the links of a worker record that another worker already reported and returns the corrected record.
+        """
+
+        query = payload.get("query")
+
+        if "summary" in payload:
+            dropped = self.dropped.pop(query, 0)
+            if not dropped:
+                return payload
+            summary = dict(payload["summary"], new=payload["summary"]["new"] - dropped, duplicates=payload["summary"]["duplicates"] + dropped)
+            return dict(payload, summary=summary)
+
+        results = payload.get("data_output")
+        if not results:
+            return payload
+
+        new_results = [result for result in results if self.seen.add(result["link"])]
+        dropped = len(results) - len(new_results)
+        if not dropped:
+            return payload
+
+        self.dropped[query] = self.dropped.get(query, 0) + dropped
+        self.metrics.count("new_links", -dropped)
+        self.metrics.count("duplicate_links", dropped)
+        return dict(payload, data_output=new_results, new=payload["new"] - dropped, duplicates=payload["duplicates"] + dropped)
+
+    def publish(self):
+        self.merged_metrics().publish(self.reports.metrics_file, self.options.get("metrics_file"))
+
+    def summarize(self):
+        metrics = self.merged_metrics()
+        metrics.publish(self.reports.metrics_file, self.options.get("metrics_file"))
+        snapshot = metrics.snapshot()
+
+        self.reports.logs_report("info", data=metrics.describe(snapshot))
+        self.reports.json_report({
+            "timestamp": str(datetime.now()),
+            "workers": self.workers,
+            "shard": f"{self.shard[0]}/{self.shard[1]}",
+            "metrics": snapshot,
+        })
+
+    def handle(self, kind, index, payload, running):
+        if kind == RECORD:
+            if self.seen is not None:
+                payload = self.deduplicate(payload)
+            self.reports.json_report(payload)
+            self.output.write(payload.get("data_output"), payload.get("query"), payload.get("page"))
+        elif kind == LOG:
+            for handler in self.reports.logger.handlers:
+                handler.write(payload)
+        elif kind == JOURNAL:
+            self.reports.after(self.checkpoint.write, payload)
+        elif kind == METRICS:
+            self.states[index] = payload
+        elif kind == DONE:
+            if payload is not None:
+                self.states[index] = payload
+            running.discard(index)
+
+    def run(self):
+        print(self.console.text_format("info", msg="A high-speed scraper for collecting links and titles from Google search results"))
+        print(self.console.text_format("warning", msg="Use with caution. You are responsible for your actions"))
+        print(self.console.text_format("warning", msg="Developers assume no liability and are not responsible for any issue or damage"))
+        print(self.console.text_format("info", msg=f"Running {self.workers} workers on shard {self.shard[0]}/{self.shard[1]}"))
+
+        # spawn keeps the workers independent of the threads already running in the parent
+        context = multiprocessing.get_context("spawn")
+        outbox = context.Queue()
+        stdin = self.dorks == "-"
+        inboxes = [context.Queue(maxsize=1024) if stdin else None for _ in range(self.workers)]
+
+        self.checkpoint.open(None if stdin else (os.path.abspath(self.dorks) if os.path.isfile(self.dorks) else self.dorks))
+
+        processes = [
+            context.Process(target=run_worker, args=(index, self.worker_shard(index), self.options, inboxes[index], outbox), name=f"godork-worker-{index}")
+            for index in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        if stdin:
+            threading.Thread(target=self.route_stdin, args=(inboxes,), name="godork-stdin-router", daemon=True).start()
+
+        running = set(range(self.workers))
+        interval = self.options.get("metrics_interval", 10.0)
+        last_publish = time.monotonic()
+
+        try:
+            while running:
+                try:
+                    self.handle(*outbox.get(timeout=0.5), running)
+                except KeyboardInterrupt:
+                    # The workers received the interrupt as well; keep collecting until they have stopped
+                    continue
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes):
+                        break
+
+                if interval > 0 and time.monotonic() - last_publish >= interval:
+                    self.publish()
+                    last_publish = time.monotonic()
+        finally:
+            while True:
+                try:
+                    self.handle(*outbox.get_nowait(), running)
+                except queue.Empty:
+                    break
+
+            for process in processes:
+                while process.is_alive():
+                    try:
+                        process.join(timeout=0.5)
+                    except KeyboardInterrupt:
+                        continue
+
+            self.summarize()
+            self.reports.close()
+            self.checkpoint.close()
+            self.output.close()
+
+        print(self.console.text_format("info", msg="Report saved to {}".format(self.reports.base_dir)))
@@ -0,0 +1,44 @@
+import os
+import json
+
+def cache_dir(*parts):
+    """
+    This function returns (and creates) the godork cache directory. It honours GODORK_CACHE_DIR, then XDG_CACHE_HOME, and falls back to ~/.cache/godork.
+    """
+
+    base = os.getenv("GODORK_CACHE_DIR") or os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "godork"
+    )
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+
+    return path
+
+def read_cache(name):
+    """
+    This function reads a JSON cache file from the cache directory and returns its content, or None if it is missing or unreadable.
+    """
+
+    try:
+        with open(os.path.join(cache_dir(), name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_cache(name, data):
+    """
+    This function atomically replaces a JSON cache file in the cache directory, so that concurrent workers never read a partial file.
+    """
+
+    path = os.path.join(cache_dir(), name)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
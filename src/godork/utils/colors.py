@@ -10,4 +10,10 @@ class Bgcolor:
     GRAY     = '\033[2m'
     BLUE     = '\033[34m'
     CYAN     = '\033[36m'
-    RED      = '\033[31m'
\ No newline at end of file
+    RED      = '\033[31m'
+
+    @classmethod
+    def disable(cls):
+        # Colours are read from the class when a message is built, so clearing them turns every ANSI code into an empty string
+        for name in ("DEFAULT", "WARNING", "PURPLE", "GREEN", "BOLD", "GRAY", "BLUE", "CYAN", "RED"):
+            setattr(cls, name, "")
@@ -1,5 +1,39 @@
+import os
+import sys
+import zlib
+
 from urllib.parse import urlparse, parse_qs, unquote
 
+def iter_dorks(source):
+    """
+    This function yields dorks one at a time from a file, from stdin (when source is "-") or from the source string itself.
+    Blank lines and lines starting with # are skipped. Files are read line by line, so memory stays constant whatever the size of the list.
+    """
+
+    if source == "-":
+        lines = sys.stdin
+    elif os.path.isfile(source):
+        with open(source, "r", encoding="utf-8", errors="replace") as f:
+            yield from iter_dorks_lines(f)
+        return
+    else:
+        lines = source.splitlines()
+
+    yield from iter_dorks_lines(lines)
+
+def iter_dorks_lines(lines):
+    for line in lines:
+        dork = line.strip()
+        if dork and not dork.startswith("#"):
+            yield dork
+
+def shard_of(query, count):
+    """
+    This function maps a dork to one of `count` shards. The hash is stable across processes and machines, unlike the built-in hash().
+    """
+
+    return zlib.crc32(query.encode("utf-8")) % count
+
 def get_page_num(url):
     """
     This function handles URL parsing, extracts query parameters, gets their values and returns the value